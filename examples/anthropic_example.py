@@ -13,11 +13,11 @@ Usage:
     python3 anthropic_example.py
 """
 
-import time
 from anthropic import Anthropic
-from agentic_learning import learning
+from agentic_learning import learning, AgenticLearning
 
 client = Anthropic()
+learning_client = AgenticLearning()
 
 def ask_claude(message: str):
     print(f"User: {message}\n")
@@ -31,9 +31,14 @@ def ask_claude(message: str):
         )
         print(f"Assistant: {response.content[0].text}\n")
 
+# Snapshot memory so wait_ready() can tell when sleep-time processing changes it
+since = learning_client.memory.context.retrieve("anthropic-demo")
+
 # Memory automatically persists across LLM API calls
 ask_claude("My name is Alice.")
 
-time.sleep(7) # Memory persists during sleep-time
+# Give sleep-time processing a few seconds to update memory (returns early once it does)
+if not learning_client.memory.wait_ready("anthropic-demo", since=since):
+    print("[No memory change yet (it may already be up to date), continuing]\n")
 
 ask_claude("What's my name?")
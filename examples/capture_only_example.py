@@ -13,9 +13,9 @@ Usage:
     python3 capture_only_example.py
 """
 
-import time
 from anthropic import Anthropic
 from agentic_learning import learning, AgenticLearning
+from utils import print_messages
 
 client = Anthropic()
 
@@ -39,28 +39,23 @@ def memory_search(prompt: str):
 
     # Search through stored memories
     messages = learning_client.memory.search("capture-only-demo", prompt)
-    
-    for message in messages:
-        if message.message_type == "user_message":
-            print(f"User: {message.content}")
-        elif message.message_type == "assistant_message":
-            print(f"Assistant: {message.content}")
+    print_messages(messages)
 
 def message_history():
     print("\n--- Message History ---\n")
 
     # List message history
     messages = learning_client.messages.list("capture-only-demo")
-    
-    for message in messages:
-        if message.message_type == "user_message":
-            print(f"User: {message.content}")
-        elif message.message_type == "assistant_message":
-            print(f"Assistant: {message.content}")
+    print_messages(messages)
+
+# Snapshot memory so wait_ready() can tell when sleep-time processing changes it
+since = learning_client.memory.context.retrieve("capture-only-demo")
 
 ask_claude("My name is Alice.")
 
-time.sleep(7) # Memory persists during sleep-time
+# Give sleep-time processing a few seconds to update memory (returns early once it does)
+if not learning_client.memory.wait_ready("capture-only-demo", since=since):
+    print("[No memory change yet (it may already be up to date), continuing]\n")
 
 # Without memory injection, Claude doesn't know about previous context
 ask_claude("What's my name?")
@@ -15,10 +15,11 @@ Usage:
 
 import asyncio
 from claude_agent_sdk import ClaudeSDKClient, ClaudeAgentOptions, AssistantMessage, TextBlock
-from agentic_learning import learning
+from agentic_learning import learning, AsyncAgenticLearning
 
 options = ClaudeAgentOptions()
 client = ClaudeSDKClient(options)
+learning_client = AsyncAgenticLearning()
 
 async def ask_claude(message: str):
     print(f"User: {message}\n")
@@ -38,11 +39,23 @@ async def ask_claude(message: str):
         await client.disconnect()
 
 async def main():
+    # Snapshot memory so wait_ready() can tell when sleep-time processing changes it
+    since = await learning_client.memory.context.retrieve("claude-demo")
+
     # Memory automatically persists across LLM API calls
     await ask_claude("My name is Alice.")
 
-    await asyncio.sleep(7) # Memory persists during sleep-time
+    # Give sleep-time processing a few seconds to update memory (returns early once it does)
+    if not await learning_client.memory.wait_ready("claude-demo", since=since):
+        print("[No memory change yet (it may already be up to date), continuing]\n")
 
     await ask_claude("What's my name?")
 
+# Use uvloop for lower event loop overhead while streaming, if installed
+try:
+    import uvloop
+    uvloop.install()
+except ImportError:
+    pass
+
 asyncio.run(main())
@@ -18,6 +18,7 @@ import os
 import sys
 from claude_agent_sdk import ClaudeSDKClient, ClaudeAgentOptions, AssistantMessage, TextBlock
 from agentic_learning import learning, AgenticLearning
+from utils import async_input
 
 
 class InteractiveSession:
@@ -60,12 +61,15 @@ class InteractiveSession:
             self.client = ClaudeSDKClient(self.options)
             await self.client.connect()
 
+            user_input = ""
             while True:
-                # Get user input
+                # Read user input off the event loop so queued captures keep sending while the user types
                 try:
-                    user_input = input(f"\n[Turn {self.turn_count + 1}] You: ").strip()
-                except (EOFError, KeyboardInterrupt):
+                    user_input = (await async_input(f"\n[Turn {self.turn_count + 1}] You: ")).strip()
+                except (EOFError, KeyboardInterrupt, asyncio.CancelledError):
+                    # Ctrl+C cancels the main task while it awaits input
                     print("\n\nSession interrupted. Saving and exiting...")
+                    user_input = ""
                     break
 
                 # Handle commands
@@ -136,7 +140,7 @@ async def main():
     print()
 
     # Get agent name
-    agent_name = input("Enter agent name (default: 'claude-interactive'): ").strip()
+    agent_name = (await async_input("Enter agent name (default: 'claude-interactive'): ")).strip()
     if not agent_name:
         agent_name = "claude-interactive"
 
@@ -170,6 +174,13 @@ async def main():
 
 
 if __name__ == "__main__":
+    # Use uvloop for lower event loop overhead while streaming, if installed
+    try:
+        import uvloop
+        uvloop.install()
+    except ImportError:
+        pass
+
     try:
         asyncio.run(main())
     except KeyboardInterrupt:
@@ -13,11 +13,11 @@ Usage:
     python3 gemini_example.py
 """
 
-import time
 import google.generativeai as genai
-from agentic_learning import learning
+from agentic_learning import learning, AgenticLearning
 
 model = genai.GenerativeModel("gemini-2.5-flash")
+learning_client = AgenticLearning()
 
 def ask_gemini(message: str):
     print(f"User: {message}\n")
@@ -27,9 +27,14 @@ def ask_gemini(message: str):
         response = model.generate_content(message)
         print(f"Assistant: {response.text}\n")
 
+# Snapshot memory so wait_ready() can tell when sleep-time processing changes it
+since = learning_client.memory.context.retrieve("gemini-demo")
+
 # Memory automatically persists across LLM API calls
 ask_gemini("My name is Alice.")
 
-time.sleep(7) # Memory persists during sleep-time
+# Give sleep-time processing a few seconds to update memory (returns early once it does)
+if not learning_client.memory.wait_ready("gemini-demo", since=since):
+    print("[No memory change yet (it may already be up to date), continuing]\n")
 
 ask_gemini("What's my name?")
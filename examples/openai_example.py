@@ -13,11 +13,11 @@ Usage:
     python3 openai_example.py
 """
 
-import time
 from openai import OpenAI
-from agentic_learning import learning
+from agentic_learning import learning, AgenticLearning
 
 client = OpenAI()
+learning_client = AgenticLearning()
 
 def ask_gpt(message: str):
     print(f"User: {message}\n")
@@ -30,9 +30,14 @@ def ask_gpt(message: str):
         )
         print(f"Assistant: {response.choices[0].message.content}\n")
 
+# Snapshot memory so wait_ready() can tell when sleep-time processing changes it
+since = learning_client.memory.context.retrieve("openai-demo")
+
 # Memory automatically persists across LLM API calls
 ask_gpt("My name is Alice.")
 
-time.sleep(7) # Memory persists during sleep-time
+# Give sleep-time processing a few seconds to update memory (returns early once it does)
+if not learning_client.memory.wait_ready("openai-demo", since=since):
+    print("[No memory change yet (it may already be up to date), continuing]\n")
 
 ask_gpt("What's my name?")
@@ -14,27 +14,27 @@ Usage:
     python3 openai_responses_example.py
 """
 
-import time
 from openai import OpenAI
-from agentic_learning import learning
+from agentic_learning import learning, AgenticLearning
 
 
 def get_text_from_output(output):
     """Extract text from Responses API output for display."""
     if isinstance(output, str):
         return output
-    elif isinstance(output, list):
-        texts = []
-        for message in output:
-            if hasattr(message, 'content'):
-                for content_item in message.content:
-                    if hasattr(content_item, 'text'):
-                        texts.append(content_item.text)
-        return ' '.join(texts) if texts else str(output)
-    return str(output)
+    if not isinstance(output, list):
+        return str(output)
+
+    texts = []
+    for message in output:
+        content = getattr(message, 'content', None)
+        if content:
+            texts.extend(item.text for item in content if hasattr(item, 'text'))
+    return ' '.join(texts) if texts else str(output)
 
 
 client = OpenAI()
+learning_client = AgenticLearning()
 
 def ask_gpt(message: str):
     print(f"User: {message}\n")
@@ -47,9 +47,14 @@ def ask_gpt(message: str):
         )
         print(f"Assistant: {get_text_from_output(response.output)}\n")
 
+# Snapshot memory so wait_ready() can tell when sleep-time processing changes it
+since = learning_client.memory.context.retrieve("openai-responses-demo")
+
 # Memory automatically persists across LLM API calls
 ask_gpt("My name is Alice.")
 
-time.sleep(7) # Memory persists during sleep-time
+# Give sleep-time processing a few seconds to update memory (returns early once it does)
+if not learning_client.memory.wait_ready("openai-responses-demo", since=since):
+    print("[No memory change yet (it may already be up to date), continuing]\n")
 
 ask_gpt("What's my name?")
@@ -13,11 +13,12 @@ Usage:
     python3 streaming_example.py
 """
 
-import time
 from anthropic import Anthropic
-from agentic_learning import learning
+from agentic_learning import learning, AgenticLearning
+from utils import DeltaPrinter
 
 client = Anthropic()
+learning_client = AgenticLearning()
 
 def ask_claude(message: str):
     print(f"User: {message}\n")
@@ -32,16 +33,24 @@ def ask_claude(message: str):
             stream=True
         )
 
+        # Batch small deltas so stdout isn't flushed once per token
+        printer = DeltaPrinter()
         for event in stream:
             if event.type == "content_block_delta":
                 if hasattr(event.delta, 'text'):
-                    print(event.delta.text, end="", flush=True)
+                    printer.write(event.delta.text)
+        printer.flush()
 
         print("\n")
 
+# Snapshot memory so wait_ready() can tell when sleep-time processing changes it
+since = learning_client.memory.context.retrieve("streaming-demo")
+
 # Memory automatically persists across LLM API calls
 ask_claude("Letta is my favorite context management service. Can you send me a summary about the product Letta (fka MemGPT) offers?")
 
-time.sleep(7) # Memory persists during sleep-time
+# Give sleep-time processing a few seconds to update memory (returns early once it does)
+if not learning_client.memory.wait_ready("streaming-demo", since=since):
+    print("[No memory change yet (it may already be up to date), continuing]\n")
 
 ask_claude("What is my favorite context management service?")
@@ -1,9 +1,12 @@
 """
 Utility functions for examples.
 
-Provides colored terminal output helpers.
+Provides colored terminal output and async input helpers.
 """
 
+import asyncio
+import sys
+import time
 from typing import List
 from letta_client.types.agents.message import Message
 
@@ -36,12 +39,89 @@ def print_r(message: str, end: str = "\n"):
     print(f"{RED}{message}{RESET}", end=end)
 
 
+async def async_input(prompt: str) -> str:
+    """
+    Read a line from stdin without blocking the event loop.
+
+    On a terminal the event loop watches stdin, so Ctrl+C at the prompt is not
+    stuck behind a thread blocked in input(). Redirected stdin (files, pipes)
+    is read with input() in the default executor instead: event loops can't
+    watch regular files, and a buffered read of piped input can pull in lines
+    the loop would never be woken up for.
+    """
+    loop = asyncio.get_running_loop()
+
+    if sys.stdin.isatty():
+        future = loop.create_future()
+        fd = sys.stdin.fileno()
+
+        def on_readable():
+            line = sys.stdin.readline()
+            if future.done():
+                return
+            if line:
+                future.set_result(line.rstrip("\n"))
+            else:
+                future.set_exception(EOFError())
+
+        try:
+            loop.add_reader(fd, on_readable)
+        except (NotImplementedError, OSError):
+            # Event loops without reader support (e.g. the Windows proactor loop)
+            pass
+        else:
+            print(prompt, end="", flush=True)
+            try:
+                return await future
+            finally:
+                loop.remove_reader(fd)
+
+    return await loop.run_in_executor(None, input, prompt)
+
+
+class DeltaPrinter:
+    """
+    Print streamed text deltas in small batches.
+
+    Queued deltas are written to stdout once `max_deltas` are queued, or on the
+    first write at least `max_delay` seconds after the previous flush, instead
+    of flushing stdout once per token. The delay is only checked when a delta
+    arrives: text queued before a pause in the stream is printed when the
+    stream resumes, so call flush() once the stream ends.
+    """
+
+    def __init__(self, max_deltas: int = 8, max_delay: float = 0.05):
+        self.max_deltas = max_deltas
+        self.max_delay = max_delay
+        self._deltas: List[str] = []
+        self._last_flush = time.monotonic()
+
+    def write(self, delta: str):
+        """Queue a delta, flushing if the batch is full or the last flush was max_delay ago."""
+        self._deltas.append(delta)
+        if len(self._deltas) >= self.max_deltas or time.monotonic() - self._last_flush >= self.max_delay:
+            self.flush()
+
+    def flush(self):
+        """Write all queued deltas to stdout."""
+        if self._deltas:
+            sys.stdout.write("".join(self._deltas))
+            sys.stdout.flush()
+            self._deltas.clear()
+        self._last_flush = time.monotonic()
+
+
+# Printers for each displayable message type
+_PRINTERS = {
+    "user_message": lambda message: print_u(message.content),
+    "assistant_message": lambda message: print_a(message.content),
+    "reasoning_message": lambda message: print_a(message.reasoning),
+}
+
+
 def print_messages(messages: List[Message]):
+    """Print user, assistant and reasoning messages, skipping other types."""
     for message in messages:
-        if message.message_type == "user_message":
-            print_u(message.content)
-        elif message.message_type == "assistant_message":
-            print_a(message.content)
-        elif message.message_type == "reasoning_message":
-            print_a(message.reasoning)
-            
+        printer = _PRINTERS.get(message.message_type)
+        if printer:
+            printer(message)
@@ -32,7 +32,7 @@ Usage with AgenticLearning Client:
     >>> agents = client.agents.list()
 """
 
-from .core import learning
+from .core import learning, set_default_client
 from .client import (
     AgenticLearning,
     AsyncAgenticLearning,
@@ -43,6 +43,7 @@ __version__ = "0.1.0"
 __all__ = [
     # Context manager (works for both sync and async)
     "learning",
+    "set_default_client",
     # Client classes
     "AgenticLearning",
     "AsyncAgenticLearning",
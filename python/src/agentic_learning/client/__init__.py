@@ -7,9 +7,17 @@ High-level client interfaces for interacting with Letta agents.
 import os
 from typing import Optional
 
+import httpx
+
 from .agents import AgentsClient, AsyncAgentsClient
 from .memory import MemoryClient, AsyncMemoryClient
 from .messages import MessagesClient, AsyncMessagesClient
+from .utils import auth_headers, http2_available
+
+
+# Connection pool for the underlying Letta client. With HTTP/2 available
+# (`pip install agentic-learning[http2]`), concurrent requests multiplex over one connection.
+_LETTA_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
 
 
 # =============================================================================
@@ -24,20 +32,30 @@ class AgenticLearning:
     Provides simplified APIs for managing Letta agents with name-based lookups.
     """
 
-    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        compress_captures: bool = False,
+    ):
         """
         Initialize the Agentic Learning client.
 
         Args:
             base_url: Letta server base URL. Defaults to LETTA_BASE_URL env var or None.
             api_key: Optional authentication api_key for Letta server. Defaults to LETTA_API_KEY env var or None.
+            compress_captures: Whether to gzip large capture payloads. Requires a Letta server
+                that accepts gzip-encoded request bodies. Defaults to False.
         """
-        from letta_client import Letta
+        from letta_client import DefaultHttpxClient, Letta
 
         self.base_url = base_url or os.getenv("LETTA_BASE_URL", None)
+        self.compress_captures = compress_captures
+        self.auth_headers = auth_headers(api_key)
         self._letta = Letta(
             api_key=api_key,
             base_url=self.base_url,
+            http_client=DefaultHttpxClient(http2=http2_available(), limits=_LETTA_HTTP_LIMITS),
         )
 
         self.agents = AgentsClient(self, self._letta)
@@ -49,6 +67,22 @@ class AgenticLearning:
         """Access the underlying Letta client for advanced operations."""
         return self._letta
 
+    def close(self):
+        """
+        Close the underlying Letta client and its pooled connections.
+
+        The capture connection pool is shared by all sync clients, so it is left
+        open and closed at interpreter exit.
+        """
+        self._letta.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+        return False
+
 
 # =============================================================================
 # Async Client
@@ -60,22 +94,35 @@ class AsyncAgenticLearning:
     Asynchronous client for Agentic Learning SDK.
 
     Provides simplified async APIs for managing Letta agents with name-based lookups.
+
+    For streaming-heavy workloads, running the event loop on uvloop
+    (`uvloop.install()` before `asyncio.run(...)`) reduces per-event overhead.
     """
 
-    def __init__(self, base_url: Optional[str] = None, api_key: Optional[str] = None):
+    def __init__(
+        self,
+        base_url: Optional[str] = None,
+        api_key: Optional[str] = None,
+        compress_captures: bool = False,
+    ):
         """
         Initialize the Async Agentic Learning client.
 
         Args:
             base_url: Letta server base URL. Defaults to LETTA_BASE_URL env var or None.
             toapi_keyken: Optional authentication api_key for Letta server. Defaults to LETTA_API_KEY env var or None.
+            compress_captures: Whether to gzip large capture payloads. Requires a Letta server
+                that accepts gzip-encoded request bodies. Defaults to False.
         """
-        from letta_client import AsyncLetta
+        from letta_client import AsyncLetta, DefaultAsyncHttpxClient
 
         self.base_url = base_url or os.getenv("LETTA_BASE_URL", None)
+        self.compress_captures = compress_captures
+        self.auth_headers = auth_headers(api_key)
         self._letta = AsyncLetta(
             api_key=api_key,
             base_url=self.base_url,
+            http_client=DefaultAsyncHttpxClient(http2=http2_available(), limits=_LETTA_HTTP_LIMITS),
         )
 
         self.agents = AsyncAgentsClient(self, self._letta)
@@ -87,5 +134,21 @@ class AsyncAgenticLearning:
         """Access the underlying AsyncLetta client for advanced operations."""
         return self._letta
 
+    async def aclose(self):
+        """
+        Close the underlying AsyncLetta client and its pooled connections.
+
+        The capture connection pool is shared by all async clients on the event
+        loop, so it is left open and closed when the loop shuts down.
+        """
+        await self._letta.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb):
+        await self.aclose()
+        return False
+
 
 __all__ = ["AgenticLearning", "AsyncAgenticLearning"]
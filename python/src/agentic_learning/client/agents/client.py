@@ -9,6 +9,7 @@ from typing import Any, List, Optional
 from letta_client.types import AgentState, SleeptimeManagerParam
 from .sleeptime import SleeptimeClient, AsyncSleeptimeClient
 from ..utils import memory_placeholder
+from ...core import _get_cached_agent_id, _set_cached_agent_id
 
 
 # =============================================================================
@@ -68,6 +69,7 @@ class AgentsClient:
                 sleeptime_agent_frequency=2,
             ),
         )
+        _set_cached_agent_id(self._parent, agent.name, agent.id)
         return agent
     
     def update(self, agent: str, model: Optional[str]) -> AgentState:
@@ -105,7 +107,11 @@ class AgentsClient:
             tags=["agentic-learning-sdk"],
             include=["agent.blocks", "agent.managed_group", "agent.tags"],
         )
-        return agents.items[0] if agents.items else None
+        if not agents.items:
+            return None
+
+        _set_cached_agent_id(self._parent, agent, agents.items[0].id)
+        return agents.items[0]
 
     def list(self) -> List[AgentState]:
         """
@@ -133,13 +139,15 @@ class AgentsClient:
         agent_id = self._retrieve_id(agent=agent)
         if agent_id:
             self._letta.agents.delete(agent_id=agent_id)
+            _set_cached_agent_id(self._parent, agent, None)
             return True
         return False
     
     def _retrieve_id(self, agent: str) -> Optional[str]:
         """
         Retrieve an agent ID by name. Skips expensive joins that are
-        unnecessary for ID fetch.
+        unnecessary for ID fetch, and reuses the ID already resolved in
+        the active learning context.
 
         Args:
             agent (str): Name of the agent to retrieve
@@ -147,11 +155,17 @@ class AgentsClient:
         Returns:
             (str | None): Agent ID if found, None otherwise
         """
+        agent_id = _get_cached_agent_id(self._parent, agent)
+        if agent_id:
+            return agent_id
+
         agents = self._letta.agents.list(
             name=agent,
             tags=["agentic-learning-sdk"],
         )
-        return agents.items[0].id if agents.items else None
+        agent_id = agents.items[0].id if agents.items else None
+        _set_cached_agent_id(self._parent, agent, agent_id)
+        return agent_id
 
 
 # =============================================================================
@@ -211,6 +225,7 @@ class AsyncAgentsClient:
                 sleeptime_agent_frequency=2,
             ),
         )
+        _set_cached_agent_id(self._parent, agent.name, agent.id)
         return agent
     
     async def update(self, agent: str, model: Optional[str]) -> AgentState:
@@ -248,7 +263,11 @@ class AsyncAgentsClient:
             tags=["agentic-learning-sdk"],
             include=["agent.blocks", "agent.managed_group", "agent.tags"],
         )
-        return agents.items[0] if agents.items else None
+        if not agents.items:
+            return None
+
+        _set_cached_agent_id(self._parent, agent, agents.items[0].id)
+        return agents.items[0]
 
     async def list(self) -> List[AgentState]:
         """
@@ -276,13 +295,15 @@ class AsyncAgentsClient:
         agent_id = await self._retrieve_id(agent=agent)
         if agent_id:
             await self._letta.agents.delete(agent_id=agent_id)
+            _set_cached_agent_id(self._parent, agent, None)
             return True
         return False
     
     async def _retrieve_id(self, agent: str) -> Optional[str]:
         """
         Retrieve an agent ID by name. Skips expensive joins that are
-        unnecessary for ID fetch.
+        unnecessary for ID fetch, and reuses the ID already resolved in
+        the active learning context.
 
         Args:
             agent (str): Name of the agent to retrieve
@@ -290,8 +311,14 @@ class AsyncAgentsClient:
         Returns:
             (str | None): Agent ID if found, None otherwise
         """
+        agent_id = _get_cached_agent_id(self._parent, agent)
+        if agent_id:
+            return agent_id
+
         agents = await self._letta.agents.list(
             name=agent,
             tags=["agentic-learning-sdk"],
         )
-        return agents.items[0].id if agents.items else None
+        agent_id = agents.items[0].id if agents.items else None
+        _set_cached_agent_id(self._parent, agent, agent_id)
+        return agent_id
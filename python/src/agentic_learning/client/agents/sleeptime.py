@@ -78,6 +78,28 @@ class SleeptimeClient:
         
         return sleeptime_agent
 
+    def _retrieve_id(self, agent: str) -> Optional[str]:
+        """
+        Retrieve the sleeptime agent ID for the agent. Skips fetching the
+        sleeptime agent itself and joins other than the managed group, which
+        are unnecessary for ID fetch.
+
+        Args:
+            agent (str): Name of the primary agent to retrieve corresponding sleeptime agent ID for
+
+        Returns:
+            (str | None): Sleeptime agent ID if found, None otherwise
+        """
+        agents = self._letta.agents.list(
+            name=agent,
+            tags=["agentic-learning-sdk"],
+            include=["agent.managed_group"],
+        )
+        primary_agent = agents.items[0] if agents.items else None
+        if not primary_agent or not primary_agent.multi_agent_group:
+            return None
+        return primary_agent.multi_agent_group.agent_ids[0]
+
 
 # =============================================================================
 # Async Sleeptime Client
@@ -149,3 +171,24 @@ class AsyncSleeptimeClient:
         
         return sleeptime_agent
 
+    async def _retrieve_id(self, agent: str) -> Optional[str]:
+        """
+        Retrieve the sleeptime agent ID for the agent. Skips fetching the
+        sleeptime agent itself and joins other than the managed group, which
+        are unnecessary for ID fetch.
+
+        Args:
+            agent (str): Name of the primary agent to retrieve corresponding sleeptime agent ID for
+
+        Returns:
+            (str | None): Sleeptime agent ID if found, None otherwise
+        """
+        agents = await self._letta.agents.list(
+            name=agent,
+            tags=["agentic-learning-sdk"],
+            include=["agent.managed_group"],
+        )
+        primary_agent = agents.items[0] if agents.items else None
+        if not primary_agent or not primary_agent.multi_agent_group:
+            return None
+        return primary_agent.multi_agent_group.agent_ids[0]
@@ -4,14 +4,24 @@ Memory Client
 Provides memory block management operations with name-based APIs.
 """
 
-from typing import Any, List, Optional
-from .context import ContextClient, AsyncContextClient
+import asyncio
+import time
+from typing import Any, List, Optional, Sequence
+from .context import ContextClient, AsyncContextClient, _format_memory_blocks
 from ..utils import memory_placeholder
 
 from letta_client.types import BlockResponse
 from letta_client.types.agents.message import Message
 
 
+# Shared immutable result returned when the agent does not exist
+_EMPTY: tuple = ()
+
+# Backoff bounds (seconds) between memory readiness polls
+_WAIT_READY_MIN_DELAY = 0.025
+_WAIT_READY_MAX_DELAY = 0.4
+
+
 # =============================================================================
 # Sync Memory Client
 # =============================================================================
@@ -165,7 +175,7 @@ class MemoryClient:
         self._letta.blocks.delete(block_id=block[0].id)
         return True
     
-    def search(self, agent: str, prompt: str) -> List[Message]:
+    def search(self, agent: str, prompt: str) -> Sequence[Message]:
         """
         Query conversation using semantic search.
 
@@ -174,14 +184,14 @@ class MemoryClient:
             prompt (str): The prompt to ask the agent.
 
         Returns:
-            (List[Message]): Message response from agent
+            (Sequence[Message]): Message response from agent
         """
-        sleeptime_agent = self._parent.agents.sleeptime.retrieve(agent=agent)
-        if not sleeptime_agent:
-            return []
+        sleeptime_agent_id = self._parent.agents.sleeptime._retrieve_id(agent=agent)
+        if not sleeptime_agent_id:
+            return _EMPTY
 
         response = self._letta.agents.messages.create(
-            agent_id=sleeptime_agent.id,
+            agent_id=sleeptime_agent_id,
             messages=[{
                 "role": "user",
                 "content": f"Search memory for the following: {prompt}"
@@ -201,12 +211,12 @@ class MemoryClient:
         Returns:
             (str): Updated memory context string used for injection
         """
-        sleeptime_agent = self._parent.agents.sleeptime.retrieve(agent=agent)
-        if not sleeptime_agent:
+        sleeptime_agent_id = self._parent.agents.sleeptime._retrieve_id(agent=agent)
+        if not sleeptime_agent_id:
             return []
 
         self._letta.agents.messages.create(
-            agent_id=sleeptime_agent.id,
+            agent_id=sleeptime_agent_id,
             messages=[{
                 "role": "user",
                 "content": prompt
@@ -214,6 +224,38 @@ class MemoryClient:
         )
         return self._parent.memory.context.retrieve(agent=agent)
 
+    def wait_ready(self, agent: str, since: Optional[str] = None, timeout: float = 7.0) -> bool:
+        """
+        Wait for the agent's learned memory to change, up to `timeout` seconds.
+
+        Polls the agent's memory blocks with exponential backoff (25ms up to 400ms)
+        until a block holds more than its placeholder value and the memory context
+        differs from `since`.
+
+        This detects a memory change, not the completion of sleep-time processing
+        for a particular turn: if processing makes no edit (e.g. the turn taught
+        the agent nothing new), it waits out the whole timeout. The default
+        timeout is therefore kept short, matching a typical sleep-time update.
+
+        Args:
+            agent (str): Name of the agent to wait for
+            since (str | None): Memory context from memory.context.retrieve() to wait for a change from
+            timeout (float): Maximum number of seconds to wait (default: 7.0)
+
+        Returns:
+            (bool): True if memory changed, False if the timeout elapsed first
+        """
+        deadline = time.monotonic() + timeout
+        delay = _WAIT_READY_MIN_DELAY
+        while True:
+            if _is_memory_ready(self.list(agent), since):
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            time.sleep(min(delay, remaining))
+            delay = min(delay * 2, _WAIT_READY_MAX_DELAY)
+
 
 # =============================================================================
 # Async Memory Client
@@ -368,7 +410,7 @@ class AsyncMemoryClient:
         await self._letta.blocks.delete(block[0].id)
         return True
     
-    async def search(self, agent: str, prompt: str) -> List[Message]:
+    async def search(self, agent: str, prompt: str) -> Sequence[Message]:
         """
         Query conversation using semantic search.
 
@@ -377,14 +419,14 @@ class AsyncMemoryClient:
             prompt (str): The prompt to ask the agent.
 
         Returns:
-            (List[Message]): Message response from agent
+            (Sequence[Message]): Message response from agent
         """
-        sleeptime_agent = await self._parent.agents.sleeptime.retrieve(agent=agent)
-        if not sleeptime_agent:
-            return []
+        sleeptime_agent_id = await self._parent.agents.sleeptime._retrieve_id(agent=agent)
+        if not sleeptime_agent_id:
+            return _EMPTY
         
         response = await self._letta.agents.messages.create(
-            agent_id=sleeptime_agent.id,
+            agent_id=sleeptime_agent_id,
             messages=[{
                 "role": "user",
                 "content": f"Search memory for the following: {prompt}"
@@ -414,4 +456,58 @@ class AsyncMemoryClient:
                 "content": f"Remember the following message: {prompt}"
             }]
         )
-        return self._parent.memory.context.retrieve(agent=agent)
\ No newline at end of file
+        return self._parent.memory.context.retrieve(agent=agent)
+
+    async def wait_ready(self, agent: str, since: Optional[str] = None, timeout: float = 7.0) -> bool:
+        """
+        Wait for the agent's learned memory to change, up to `timeout` seconds.
+
+        Polls the agent's memory blocks with exponential backoff (25ms up to 400ms)
+        until a block holds more than its placeholder value and the memory context
+        differs from `since`.
+
+        This detects a memory change, not the completion of sleep-time processing
+        for a particular turn: if processing makes no edit (e.g. the turn taught
+        the agent nothing new), it waits out the whole timeout. The default
+        timeout is therefore kept short, matching a typical sleep-time update.
+
+        Args:
+            agent (str): Name of the agent to wait for
+            since (str | None): Memory context from memory.context.retrieve() to wait for a change from
+            timeout (float): Maximum number of seconds to wait (default: 7.0)
+
+        Returns:
+            (bool): True if memory changed, False if the timeout elapsed first
+        """
+        deadline = time.monotonic() + timeout
+        delay = _WAIT_READY_MIN_DELAY
+        while True:
+            if _is_memory_ready(await self.list(agent), since):
+                return True
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                return False
+            await asyncio.sleep(min(delay, remaining))
+            delay = min(delay * 2, _WAIT_READY_MAX_DELAY)
+
+
+# =============================================================================
+# Helper Functions
+# =============================================================================
+
+
+def _is_memory_ready(blocks: List[BlockResponse], since: Optional[str]) -> bool:
+    """
+    Check whether memory blocks hold learned content.
+
+    Args:
+        blocks (list[BlockResponse]): Memory blocks of the agent
+        since (str | None): Previous memory context the blocks must differ from
+
+    Returns:
+        (bool): True if any block has a non-placeholder value and the context changed
+    """
+    learned = any(block.value and block.value != memory_placeholder(block.label) for block in blocks)
+    if not learned:
+        return False
+    return since is None or _format_memory_blocks(blocks) != since
@@ -4,12 +4,210 @@ Messages Client
 Provides message management operations with name-based APIs.
 """
 
-import os
-from typing import Any, List, Literal, Optional
-
+import asyncio
+import atexit
+import dataclasses
+import datetime
+import enum
+import gzip
+import json
+import uuid
+import logging
+import threading
+import weakref
+from typing import Any, Dict, List, Literal, Optional, Sequence, Tuple
+
+import httpx
 from letta_client.types.agents.message import Message
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 from .context import ContextClient, AsyncContextClient
+from ..utils import close_on_loop_shutdown, http2_available
+
+
+logger = logging.getLogger(__name__)
+
+# Shared immutable result returned when the agent does not exist
+_EMPTY: tuple = ()
+
+
+# =============================================================================
+# Shared HTTP Clients
+# =============================================================================
+
+
+# Capture POSTs reuse pooled connections so each turn skips the TCP/TLS handshake,
+# multiplexed over HTTP/2 when h2 is installed
+_HTTP_TIMEOUT = 30.0
+_HTTP_LIMITS = httpx.Limits(max_keepalive_connections=20, max_connections=100)
+
+_http_client: Optional[httpx.Client] = None
+_http_client_lock = threading.Lock()
+# Async clients hold loop-bound connections, so there is one per event loop
+_async_http_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = weakref.WeakKeyDictionary()
+
+# Capture bodies at least this large are gzip-compressed when the client enables it
+_GZIP_MIN_BYTES = 4096
+
+
+def _get_http_client() -> httpx.Client:
+    """
+    Get the shared sync HTTP client, creating it on first use.
+
+    Returns:
+        (httpx.Client): Pooled HTTP client
+    """
+    global _http_client
+
+    if _http_client is None:
+        with _http_client_lock:
+            if _http_client is None:
+                _http_client = httpx.Client(
+                    timeout=_HTTP_TIMEOUT,
+                    limits=_HTTP_LIMITS,
+                    http2=http2_available(),
+                )
+                atexit.register(_http_client.close)
+    return _http_client
+
+
+def _get_async_http_client() -> httpx.AsyncClient:
+    """
+    Get the shared async HTTP client for the running event loop, creating it on first use.
+
+    Pooled connections are bound to the loop that opened them, so each event
+    loop (e.g. across asyncio.run calls or in different threads) gets its own
+    client, which is closed when that loop shuts down.
+
+    Returns:
+        (httpx.AsyncClient): Pooled async HTTP client
+    """
+    loop = asyncio.get_running_loop()
+    with _http_client_lock:
+        http_client = _async_http_clients.get(loop)
+        if http_client is None:
+            http_client = _async_http_clients[loop] = httpx.AsyncClient(
+                timeout=_HTTP_TIMEOUT,
+                limits=_HTTP_LIMITS,
+                http2=http2_available(),
+            )
+            close_on_loop_shutdown(http_client.aclose)
+    return http_client
+
+
+def _build_capture_headers(auth_headers: Dict[str, str]) -> Tuple[Dict[str, str], Dict[str, str]]:
+    """
+    Build the headers for the Letta capture endpoint.
+
+    Args:
+        auth_headers (dict): Authorization headers of the client
+
+    Returns:
+        (tuple[dict, dict]): Headers for plain and gzip-compressed JSON bodies
+    """
+    headers = {"Content-Type": "application/json", **auth_headers}
+    return headers, {**headers, "Content-Encoding": "gzip"}
+
+
+def _json_default(value: Any) -> Any:
+    """
+    Convert values orjson serializes natively, so the stdlib fallback matches it.
+
+    Args:
+        value (Any): Value the json module can't serialize
+
+    Returns:
+        (Any): JSON-serializable equivalent
+    """
+    if isinstance(value, (datetime.datetime, datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, enum.Enum):
+        return value.value
+    if dataclasses.is_dataclass(value) and not isinstance(value, type):
+        return dataclasses.asdict(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+
+def _encode_payload(payload: dict) -> bytes:
+    """
+    Serialize a capture payload to JSON bytes, using orjson when installed.
+
+    Both encoders accept the same types. NaN and infinity are the exception:
+    orjson writes them as null, while the stdlib encoder rejects them (as httpx
+    does) with ValueError.
+
+    Args:
+        payload (dict): Capture request payload
+
+    Returns:
+        (bytes): UTF-8 encoded JSON body
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+        except TypeError:
+            # orjson.JSONEncodeError (e.g. integers beyond 64 bits); let the stdlib handle it
+            pass
+    return json.dumps(
+        payload,
+        ensure_ascii=False,
+        separators=(",", ":"),
+        allow_nan=False,
+        default=_json_default,
+    ).encode("utf-8")
+
+
+def _encode_capture_payload(
+    request_messages: List[dict],
+    response_dict: dict,
+    model: str,
+    provider: str,
+) -> bytes:
+    """
+    Serialize a conversation turn into a capture request body.
+
+    Args:
+        request_messages (List[dict]): List of dictionaries with 'role' and 'content' fields
+        response_dict (dict): Response from downstream llm provider
+        model (str): Name of the model used for the request
+        provider (str): Provider used for the request
+
+    Returns:
+        (bytes): UTF-8 encoded JSON body
+    """
+    return _encode_payload({
+        "provider": provider,
+        "request_messages": request_messages or [],
+        "response_dict": response_dict or {},
+        "model": model,
+    })
+
+
+def _build_capture_request(
+    body: bytes,
+    compress: bool,
+    headers: Tuple[Dict[str, str], Dict[str, str]],
+) -> Tuple[bytes, Dict[str, str]]:
+    """
+    Build the (optionally compressed) body and headers for a capture request.
+
+    Args:
+        body (bytes): Encoded capture request body
+        compress (bool): Whether to gzip bodies of at least _GZIP_MIN_BYTES
+        headers (tuple[dict, dict]): Headers for plain and gzip-compressed bodies
+
+    Returns:
+        (tuple[bytes, dict]): Request body and headers
+    """
+    if compress and len(body) >= _GZIP_MIN_BYTES:
+        return gzip.compress(body, compresslevel=1), headers[1]
+    return body, headers[0]
 
 
 # =============================================================================
@@ -34,6 +232,7 @@ class MessagesClient:
         """
         self._parent = parent_client
         self._letta = letta_client
+        self._capture_headers = _build_capture_headers(parent_client.auth_headers)
         self.context = ContextClient(parent_client, letta_client)
 
     def list(
@@ -44,7 +243,7 @@ class MessagesClient:
         limit: int = 50,
         order: Literal["asc", "desc"] = "desc",
         order_by: Literal["created_at"] = "created_at",
-    ) -> List[Message]:
+    ) -> Sequence[Message]:
         """
         List all messages for the agent.
 
@@ -57,11 +256,11 @@ class MessagesClient:
             order_by (Literal["created_at"]: Order by field (default: "created_at")
 
         Returns:
-            (List[Message]): Paginated list of message objects
+            (Sequence[Message]): Paginated list of message objects
         """
         agent_id = self._parent.agents._retrieve_id(agent=agent)
         if not agent_id:
-            return []
+            return _EMPTY
         result = self._letta.agents.messages.list(
             agent_id=agent_id,
             before=before,
@@ -93,6 +292,50 @@ class MessagesClient:
         Returns:
             (str): JSON response with success status
         """
+        response = self._post_capture(
+            agent=agent,
+            body=_encode_capture_payload(request_messages, response_dict, model, provider),
+        )
+        if response is None:
+            return None
+
+        response.raise_for_status()
+        return response.json()
+
+    def _capture_turn(self, agent: str, body: bytes) -> bool:
+        """
+        Capture a conversation turn without raising on error responses.
+
+        Used by the interceptors, which treat captures as best-effort telemetry
+        and encode each turn once with _encode_capture_payload.
+
+        Args:
+            agent (str): Name of the agent to capture messages for
+            body (bytes): Encoded capture request body
+
+        Returns:
+            (bool): True if Letta accepted the capture, False otherwise
+        """
+        response = self._post_capture(agent=agent, body=body)
+        if response is None:
+            return False
+
+        if response.status_code >= 400:
+            logger.debug("Capture for agent %s failed with status %s", agent, response.status_code)
+            return False
+        return True
+
+    def _post_capture(self, agent: str, body: bytes) -> Optional[httpx.Response]:
+        """
+        POST an encoded conversation turn to the Letta capture endpoint.
+
+        Args:
+            agent (str): Name of the agent to capture messages for
+            body (bytes): Encoded capture request body
+
+        Returns:
+            (httpx.Response | None): Capture response, or None if the agent does not exist
+        """
         agent_id = self._parent.agents._retrieve_id(agent=agent)
         if not agent_id:
             return None
@@ -101,25 +344,13 @@ class MessagesClient:
         base_url = self._parent.base_url or 'https://api.letta.com'
         message_capture_url = f"{base_url}/v1/agents/{agent_id}/messages/capture"
 
-        # Build request payload
-        payload = {
-            "provider": provider,
-            "request_messages": request_messages or [],
-            "response_dict": response_dict or {},
-            "model": model,
-        }
-
         # Make sync POST request to Letta capture endpoint
-        import httpx
-
-        # Get auth token from client
-        token = os.getenv("LETTA_API_KEY", None)
-        headers = {"Authorization": f"Bearer {token}"} if token else {}
-
-        with httpx.Client(timeout=30.0) as http_client:
-            response = http_client.post(message_capture_url, json=payload, headers=headers)
-            response.raise_for_status()
-            return response.json()
+        content, headers = _build_capture_request(
+            body,
+            compress=self._parent.compress_captures,
+            headers=self._capture_headers,
+        )
+        return _get_http_client().post(message_capture_url, content=content, headers=headers)
 
     def create(self, agent: str, messages: List[dict]) -> List[Message]:
         """
@@ -164,6 +395,7 @@ class AsyncMessagesClient:
         """
         self._parent = parent_client
         self._letta = letta_client
+        self._capture_headers = _build_capture_headers(parent_client.auth_headers)
         self.context = AsyncContextClient(parent_client, letta_client)
 
     async def list(
@@ -174,7 +406,7 @@ class AsyncMessagesClient:
         limit: int = 50,
         order: Literal["asc", "desc"] = "desc",
         order_by: Literal["created_at"] = "created_at",
-    ) -> List[Message]:
+    ) -> Sequence[Message]:
         """
         List all messages for the agent.
 
@@ -187,11 +419,11 @@ class AsyncMessagesClient:
             order_by (Literal["created_at"]: Order by field (default: "created_at")
 
         Returns:
-            (List[Message]): List of message objects
+            (Sequence[Message]): List of message objects
         """
         agent_id = await self._parent.agents._retrieve_id(agent=agent)
         if not agent_id:
-            return []
+            return _EMPTY
         result = await self._letta.agents.messages.list(
             agent_id=agent_id,
             before=before,
@@ -223,6 +455,50 @@ class AsyncMessagesClient:
         Returns:
             (str): JSON response with success status
         """
+        response = await self._post_capture(
+            agent=agent,
+            body=_encode_capture_payload(request_messages, response_dict, model, provider),
+        )
+        if response is None:
+            return None
+
+        response.raise_for_status()
+        return response.json()
+
+    async def _capture_turn(self, agent: str, body: bytes) -> bool:
+        """
+        Capture a conversation turn without raising on error responses.
+
+        Used by the interceptors, which treat captures as best-effort telemetry
+        and encode each turn once with _encode_capture_payload.
+
+        Args:
+            agent (str): Name of the agent to capture messages for
+            body (bytes): Encoded capture request body
+
+        Returns:
+            (bool): True if Letta accepted the capture, False otherwise
+        """
+        response = await self._post_capture(agent=agent, body=body)
+        if response is None:
+            return False
+
+        if response.status_code >= 400:
+            logger.debug("Capture for agent %s failed with status %s", agent, response.status_code)
+            return False
+        return True
+
+    async def _post_capture(self, agent: str, body: bytes) -> Optional[httpx.Response]:
+        """
+        POST an encoded conversation turn to the Letta capture endpoint.
+
+        Args:
+            agent (str): Name of the agent to capture messages for
+            body (bytes): Encoded capture request body
+
+        Returns:
+            (httpx.Response | None): Capture response, or None if the agent does not exist
+        """
         agent_id = await self._parent.agents._retrieve_id(agent=agent)
         if not agent_id:
             return None
@@ -231,25 +507,13 @@ class AsyncMessagesClient:
         base_url = self._parent.base_url or 'https://api.letta.com'
         message_capture_url = f"{base_url}/v1/agents/{agent_id}/messages/capture"
 
-        # Build request payload
-        payload = {
-            "provider": provider,
-            "request_messages": request_messages or [],
-            "response_dict": response_dict or {},
-            "model": model,
-        }
-
         # Make async POST request to Letta capture endpoint
-        import httpx
-        
-        # Get auth token from client
-        token = os.getenv("LETTA_API_KEY", None)
-        headers = {"Authorization": f"Bearer {token}"} if token else {}
-        
-        async with httpx.AsyncClient(timeout=30.0) as http_client:
-            response = await http_client.post(message_capture_url, json=payload, headers=headers)
-            response.raise_for_status()
-            return response.json()
+        content, headers = _build_capture_request(
+            body,
+            compress=self._parent.compress_captures,
+            headers=self._capture_headers,
+        )
+        return await _get_async_http_client().post(message_capture_url, content=content, headers=headers)
     
     async def create(
         self,
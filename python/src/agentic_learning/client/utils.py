@@ -1,3 +1,15 @@
+import asyncio
+import functools
+import importlib.util
+import os
+import weakref
+from typing import Any, AsyncGenerator, Awaitable, Callable, Dict, List, Optional
+
+
+# Closers parked on each event loop until it shuts down
+_LOOP_CLOSERS: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, List[AsyncGenerator]]" = weakref.WeakKeyDictionary()
+
+
 def memory_placeholder(label: str) -> str:
     """
     Generate a memory placeholder string for a given label.
@@ -12,3 +24,56 @@ def memory_placeholder(label: str) -> str:
            "I don't yet know anything about them. " \
            "I should update this memory over time as I interact with the human " \
            f"and learn more about {label if label != 'human' else 'them'}."
+
+
+@functools.lru_cache(maxsize=None)
+def http2_available() -> bool:
+    """
+    Check whether HTTP/2 support for httpx (the `h2` package) is installed.
+
+    Returns:
+        (bool): True if httpx clients can be created with http2=True
+    """
+    return importlib.util.find_spec("h2") is not None
+
+
+def auth_headers(api_key: Optional[str] = None) -> Dict[str, str]:
+    """
+    Build the Authorization header for Letta requests.
+
+    Args:
+        api_key (str | None): API key to use. Defaults to LETTA_API_KEY env var.
+
+    Returns:
+        (dict): Authorization header, or an empty dict if no API key is available
+    """
+    token = api_key or os.getenv("LETTA_API_KEY", None)
+    return {"Authorization": f"Bearer {token}"} if token else {}
+
+
+def close_on_loop_shutdown(close: Callable[[], Awaitable[Any]]):
+    """
+    Await `close` on the running event loop when that loop shuts down.
+
+    Pooled async connections are bound to the loop that opened them and can't
+    be closed from another loop once theirs has stopped. asyncio.run() (and any
+    loop owner calling loop.shutdown_asyncgens()) finalizes live async generators
+    before closing the loop, so a generator parked at its first yield runs
+    `close` from its finally block, on the loop that owns the connections.
+
+    Args:
+        close (Callable): Coroutine function releasing loop-bound resources
+    """
+    async def closer():
+        try:
+            yield
+        finally:
+            await close()
+
+    agen = closer()
+    # The first iteration registers the generator with the running loop's shutdown
+    try:
+        agen.asend(None).send(None)
+    except StopIteration:
+        pass
+    _LOOP_CLOSERS.setdefault(asyncio.get_running_loop(), []).append(agen)
@@ -5,37 +5,205 @@ This module provides a unified context manager for automatic learning/memory int
 with Letta. It captures conversation turns and saves them to Letta for persistent memory.
 """
 
+import asyncio
+import threading
+import time
+import weakref
 from contextvars import ContextVar, Token
-from typing import List, Optional, Union
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, List, Optional, Union
 
+if TYPE_CHECKING:
+    from .client import AgenticLearning, AsyncAgenticLearning
+    from .interceptors.utils import CaptureBuffer
 
-_LEARNING_CONFIG: ContextVar[Optional[dict]] = ContextVar('learning_config', default=None)
+
+@dataclass(slots=True)
+class LearningRuntime:
+    """
+    Mutable per-context state updated while a learning context is active.
+
+    Attributes:
+        pending_user_message: User message buffered until the response is captured
+        agent_id: Agent ID resolved earlier in this context
+        agent_id_expires_at: Monotonic time after which agent_id is resolved again
+    """
+
+    pending_user_message: Optional[Any] = None
+    agent_id: Optional[str] = None
+    agent_id_expires_at: float = 0.0
+
+
+@dataclass(frozen=True, slots=True)
+class LearningConfig:
+    """
+    Configuration of the active learning context.
+
+    The configuration itself is immutable; state that changes during the
+    context lives on `runtime`.
+
+    Attributes:
+        agent_name: Name of the Letta agent used for memory storage
+        client: AgenticLearning or AsyncAgenticLearning client instance
+        capture_only: Whether to skip auto-injecting memory into prompts
+        memory: List of Letta memory block labels to configure for the agent
+        capture_buffer: Buffer batching async captures for this context (async contexts only)
+        runtime: Mutable state of this context
+    """
+
+    agent_name: str
+    client: Any
+    capture_only: bool
+    memory: List[str]
+    capture_buffer: Optional["CaptureBuffer"] = None
+    runtime: LearningRuntime = field(default_factory=LearningRuntime)
+
+
+_LEARNING_CONFIG: ContextVar[Optional[LearningConfig]] = ContextVar('learning_config', default=None)
+
+# Seconds a resolved agent ID is reused before looking it up again, in case the
+# agent is deleted or recreated outside this context
+_AGENT_ID_TTL = 60.0
 
 # Track whether interceptors have been installed
 _INTERCEPTORS_INSTALLED = False
+_INTERCEPTORS_LOCK = threading.Lock()
+
+# Default clients shared by learning() contexts created without a client
+_DEFAULT_CLIENT_LOCK = threading.Lock()
+_default_client: Optional["AgenticLearning"] = None
+_default_async_client: Optional["AsyncAgenticLearning"] = None
+# Lazily created async defaults, one per event loop since their connections are loop-bound
+_default_async_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, AsyncAgenticLearning]" = weakref.WeakKeyDictionary()
 
 
-def get_current_config() -> Optional[dict]:
+def get_current_config() -> Optional[LearningConfig]:
     """Get the current active learning configuration (context-local)."""
     return _LEARNING_CONFIG.get()
 
 
+def set_default_client(client: Union["AgenticLearning", "AsyncAgenticLearning", None]):
+    """
+    Set the client used by learning() contexts created without a client.
+
+    Args:
+        client: AgenticLearning or AsyncAgenticLearning client instance to share,
+                or None to reset both defaults so they are recreated on next use
+    """
+    global _default_client, _default_async_client
+
+    from .client import AsyncAgenticLearning
+
+    with _DEFAULT_CLIENT_LOCK:
+        if client is None:
+            _default_client = None
+            _default_async_client = None
+            _default_async_clients.clear()
+        elif isinstance(client, AsyncAgenticLearning):
+            # An explicitly set async client is used on any event loop
+            _default_async_client = client
+        else:
+            _default_client = client
+
+
+def _get_default_client() -> "AgenticLearning":
+    """
+    Get the shared default sync client, creating it on first use.
+
+    Returns:
+        Default AgenticLearning client
+    """
+    global _default_client
+
+    if _default_client is None:
+        with _DEFAULT_CLIENT_LOCK:
+            if _default_client is None:
+                from .client import AgenticLearning
+                _default_client = AgenticLearning()
+    return _default_client
+
+
+def _get_default_async_client() -> "AsyncAgenticLearning":
+    """
+    Get the shared default async client, creating it on first use.
+
+    Unless one was set with set_default_client(), a client is created for each
+    event loop, since its connections are bound to the loop (e.g. across
+    asyncio.run calls or loops running in different threads). Each lazily
+    created client is closed when its loop shuts down.
+
+    Returns:
+        Default AsyncAgenticLearning client
+    """
+    loop = asyncio.get_running_loop()
+    with _DEFAULT_CLIENT_LOCK:
+        client = _default_async_client
+        if client is None:
+            client = _default_async_clients.get(loop)
+        if client is None:
+            from .client import AsyncAgenticLearning
+            from .client.utils import close_on_loop_shutdown
+            client = _default_async_clients[loop] = AsyncAgenticLearning()
+            close_on_loop_shutdown(client.aclose)
+    return client
+
+
+def _get_cached_agent_id(client, agent: str) -> Optional[str]:
+    """
+    Get the agent ID resolved earlier in the active learning context.
+
+    Args:
+        client: Client performing the lookup
+        agent: Name of the agent
+
+    Returns:
+        Cached agent ID if the active context matches the client and agent and
+        the ID has not expired, None otherwise
+    """
+    config = _LEARNING_CONFIG.get()
+    if config and config.client is client and config.agent_name == agent:
+        runtime = config.runtime
+        if runtime.agent_id and time.monotonic() < runtime.agent_id_expires_at:
+            return runtime.agent_id
+    return None
+
+
+def _set_cached_agent_id(client, agent: str, agent_id: Optional[str]):
+    """
+    Cache (or clear) the resolved agent ID on the active learning context.
+
+    Args:
+        client: Client that performed the lookup
+        agent: Name of the agent
+        agent_id: Resolved agent ID, or None to clear the cache
+    """
+    config = _LEARNING_CONFIG.get()
+    if config and config.client is client and config.agent_name == agent:
+        config.runtime.agent_id = agent_id
+        config.runtime.agent_id_expires_at = time.monotonic() + _AGENT_ID_TTL if agent_id else 0.0
+
+
 def _ensure_interceptors_installed():
     """
     Ensure SDK interceptors are installed (one-time setup).
 
     This auto-detects available SDKs and installs interceptors for them.
-    Only runs once per process.
+    Only runs once per process, even when contexts are entered concurrently
+    from multiple threads.
     """
     global _INTERCEPTORS_INSTALLED
 
     if _INTERCEPTORS_INSTALLED:
         return
 
-    from .interceptors import install
-    install()
+    with _INTERCEPTORS_LOCK:
+        if _INTERCEPTORS_INSTALLED:
+            return
 
-    _INTERCEPTORS_INSTALLED = True
+        from .interceptors import install
+        install()
+
+        _INTERCEPTORS_INSTALLED = True
 
 
 # =============================================================================
@@ -56,6 +224,8 @@ class LearningContext:
         client: Optional[Union["AgenticLearning", "AsyncAgenticLearning"]],
         capture_only: bool,
         memory: List[str],
+        batch_max: int = 16,
+        batch_max_delay_ms: float = 250,
     ):
         """
         Initialize learning context.
@@ -65,29 +235,68 @@ class LearningContext:
             client: AgenticLearning or AsyncAgenticLearning client instance
             capture_only: Whether to skip auto-injecting memory into prompts
             memory: List of Letta memory block labels to configure for the agent
+            batch_max: Number of queued async captures that triggers an immediate send
+            batch_max_delay_ms: Milliseconds to wait for more async captures before sending
         """
         self.agent_name = agent
         self.client = client
         self.capture_only = capture_only
         self.memory = memory
+        self.batch_max = batch_max
+        self.batch_max_delay_ms = batch_max_delay_ms
         self._token: Optional[Token] = None
+        self._capture_buffer: Optional["CaptureBuffer"] = None
+
+    def _matches(self, config: Optional[LearningConfig], async_context: bool = False) -> bool:
+        """
+        Check whether an active config already has this context's settings.
+
+        Args:
+            config: Active learning config, if any
+            async_context: Whether the config must also carry a matching capture buffer
+
+        Returns:
+            True if entering this context can reuse the active config
+        """
+        if config is None:
+            return False
+
+        if not (
+            config.client is self.client
+            and config.agent_name == self.agent_name
+            and config.capture_only == self.capture_only
+            and config.memory == self.memory
+        ):
+            return False
+
+        if not async_context:
+            return True
+
+        buffer = config.capture_buffer
+        return (
+            buffer is not None
+            and buffer.max_batch == self.batch_max
+            and buffer.flush_interval == self.batch_max_delay_ms / 1000
+        )
 
     def __enter__(self):
         """Enter the learning context (sync)."""
         _ensure_interceptors_installed()
 
         if self.client is None:
-            from .client import AgenticLearning
-            self.client = AgenticLearning()
-
-        self._token = _LEARNING_CONFIG.set({
-            "agent_name": self.agent_name,
-            "client": self.client,
-            "capture_only": self.capture_only,
-            "memory": self.memory,
-            "pending_user_message": None,
-            "pending_tasks": [] 
-        })
+            self.client = _get_default_client()
+
+        # Nested context with the same settings: keep the active config
+        if self._matches(_LEARNING_CONFIG.get()):
+            self._token = None
+            return self
+
+        self._token = _LEARNING_CONFIG.set(LearningConfig(
+            agent_name=self.agent_name,
+            client=self.client,
+            capture_only=self.capture_only,
+            memory=self.memory,
+        ))
 
         return self
 
@@ -103,35 +312,37 @@ class LearningContext:
         _ensure_interceptors_installed()
 
         if self.client is None:
-            from .client import AsyncAgenticLearning
-            self.client = AsyncAgenticLearning()
-
-        self._token = _LEARNING_CONFIG.set({
-            "agent_name": self.agent_name,
-            "client": self.client,
-            "capture_only": self.capture_only,
-            "memory": self.memory,
-            "pending_user_message": None,
-            "pending_tasks": []  
-        })
+            self.client = _get_default_async_client()
+
+        # Nested context with the same settings: keep the active config and
+        # flush its capture buffer on exit
+        current = _LEARNING_CONFIG.get()
+        if self._matches(current, async_context=True):
+            self._token = None
+            self._capture_buffer = current.capture_buffer
+            return self
+
+        from .interceptors.utils import CaptureBuffer
+        self._capture_buffer = CaptureBuffer(
+            max_batch=self.batch_max,
+            flush_interval=self.batch_max_delay_ms / 1000,
+        )
+
+        self._token = _LEARNING_CONFIG.set(LearningConfig(
+            agent_name=self.agent_name,
+            client=self.client,
+            capture_only=self.capture_only,
+            memory=self.memory,
+            capture_buffer=self._capture_buffer,
+        ))
 
         return self
 
     async def __aexit__(self, exc_type, exc_val, exc_tb):
         """Exit the learning context (async)."""
-        # Wait for any pending capture tasks (from Claude interceptor) to complete
-        # before resetting context. This ensures the capture logic has access to config.
-        config = _LEARNING_CONFIG.get()
-        if config:
-            pending_tasks = config.get("pending_tasks", [])
-            if pending_tasks:
-                # Give pending tasks a short grace period to complete
-                import asyncio
-                try:
-                    await asyncio.wait(pending_tasks, timeout=5.0)
-                except asyncio.TimeoutError:
-                    # Tasks didn't complete in time
-                    pass
+        # Send any queued captures before leaving the context
+        if self._capture_buffer is not None:
+            await self._capture_buffer.flush()
 
         if self._token is not None:
             _LEARNING_CONFIG.reset(self._token)
@@ -144,6 +355,8 @@ def learning(
     client: Optional[Union["AgenticLearning", "AsyncAgenticLearning"]] = None,
     capture_only: bool = False,
     memory: List[str] = ["human"],
+    batch_max: int = 16,
+    batch_max_delay_ms: float = 250,
 ) -> LearningContext:
     """
     Create a learning context for automatic Letta integration.
@@ -160,9 +373,14 @@ def learning(
     Args:
         agent: Name of the Letta agent to use for memory storage. Defaults to 'letta_agent'.
         client: Optional AgenticLearning or AsyncAgenticLearning client instance.
-                If None, will create appropriate client based on usage (sync vs async).
+                If None, uses a shared default client based on usage (sync vs async).
+                See set_default_client() to override it.
         capture_only: Whether to capture conversations without automatic Letta memory injection (default: False)
         memory: Optional list of Letta memory blocks to configure for the agent (default: ["human"])
+        batch_max: Number of queued conversation turns that triggers an immediate save in async
+                   contexts (default: 16)
+        batch_max_delay_ms: Milliseconds to wait for more turns before saving a batch in async
+                            contexts (default: 250)
 
     Returns:
         LearningContext that can be used with both 'with' and 'async with'
@@ -190,4 +408,6 @@ def learning(
         client=client,
         capture_only=capture_only,
         memory=memory,
+        batch_max=batch_max,
+        batch_max_delay_ms=batch_max_delay_ms,
     )
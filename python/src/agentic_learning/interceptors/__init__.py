@@ -4,19 +4,33 @@ Agentic Learning Interceptors
 Automatic SDK integration for capturing conversations and injecting memory.
 """
 
+import importlib
+
 from .base import BaseInterceptor, BaseAPIInterceptor
-from .gemini import GeminiInterceptor
-from .claude import ClaudeInterceptor
-from .anthropic import AnthropicInterceptor
-from .openai import OpenAIInterceptor
-from .registry import install, register_interceptor, uninstall_all
+from .registry import install, register_interceptor, register_lazy_interceptor, uninstall_all
 from ..types import Provider
 
+# Built-in interceptors, imported only once their SDK has been imported:
+# class name -> (SDK module, interceptor module)
+_LAZY_INTERCEPTORS = {
+    "GeminiInterceptor": ("google.generativeai", ".gemini"),
+    "ClaudeInterceptor": ("claude_agent_sdk", ".claude"),
+    "AnthropicInterceptor": ("anthropic", ".anthropic"),
+    "OpenAIInterceptor": ("openai", ".openai"),
+}
+
 # Register available interceptors
-register_interceptor(GeminiInterceptor)
-register_interceptor(ClaudeInterceptor)
-register_interceptor(AnthropicInterceptor)
-register_interceptor(OpenAIInterceptor)
+for _name, (_sdk_module, _module) in _LAZY_INTERCEPTORS.items():
+    register_lazy_interceptor(_sdk_module, f"{__name__}{_module}:{_name}")
+
+
+def __getattr__(name: str):
+    """Import built-in interceptor classes on first access."""
+    if name in _LAZY_INTERCEPTORS:
+        module = importlib.import_module(_LAZY_INTERCEPTORS[name][1], __name__)
+        return getattr(module, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
 
 __all__ = [
     "BaseInterceptor",
@@ -28,5 +42,6 @@ __all__ = [
     "OpenAIInterceptor",
     "install",
     "register_interceptor",
+    "register_lazy_interceptor",
     "uninstall_all",
 ]
@@ -5,8 +5,12 @@ Abstract base class for SDK interceptors.
 """
 
 from abc import ABC, abstractmethod
-from typing import Any, AsyncGenerator, Dict, Generator
+from typing import Any, AsyncGenerator, Dict, Generator, Optional, Tuple
 import functools
+import sys
+
+from ..core import LearningConfig, get_current_config
+from .utils import _CAPTURE_ERRORS, _save_conversation_turn, _save_conversation_turn_async
 
 
 class BaseInterceptor(ABC):
@@ -264,7 +268,7 @@ class BaseAPIInterceptor(BaseInterceptor):
     # Helper Methods
     # =========================================================================
 
-    def _retrieve_and_inject_memory(self, config: Dict, kwargs: Dict) -> Dict:
+    def _retrieve_and_inject_memory(self, config: "LearningConfig", kwargs: Dict) -> Dict:
         """
         Retrieve memory context and inject into kwargs if enabled.
 
@@ -275,11 +279,11 @@ class BaseAPIInterceptor(BaseInterceptor):
         Returns:
             Modified kwargs with memory injected (or unchanged if disabled)
         """
-        if config.get('capture_only', False):
+        if config.capture_only:
             return kwargs
 
-        client = config.get('client')
-        agent_name = config.get('agent_name')
+        client = config.client
+        agent_name = config.agent_name
 
         if not client or not agent_name:
             return kwargs
@@ -288,14 +292,13 @@ class BaseAPIInterceptor(BaseInterceptor):
             memory_context = client.memory.context.retrieve(agent=agent_name)
             if memory_context:
                 kwargs = self.inject_memory_context(kwargs, memory_context)
-        except Exception as e:
+        except _CAPTURE_ERRORS as e:
             # Log error but don't crash
-            import sys
             print(f"[Warning] Memory injection failed: {e}", file=sys.stderr)
 
         return kwargs
 
-    async def _retrieve_and_inject_memory_async(self, config: Dict, kwargs: Dict) -> Dict:
+    async def _retrieve_and_inject_memory_async(self, config: "LearningConfig", kwargs: Dict) -> Dict:
         """
         Retrieve memory context and inject into kwargs if enabled (async version).
 
@@ -306,11 +309,11 @@ class BaseAPIInterceptor(BaseInterceptor):
         Returns:
             Modified kwargs with memory injected (or unchanged if disabled)
         """
-        if config.get('capture_only', False):
+        if config.capture_only:
             return kwargs
 
-        client = config.get('client')
-        agent_name = config.get('agent_name')
+        client = config.client
+        agent_name = config.agent_name
 
         if not client or not agent_name:
             return kwargs
@@ -319,9 +322,8 @@ class BaseAPIInterceptor(BaseInterceptor):
             memory_context = await client.memory.context.retrieve(agent=agent_name)
             if memory_context:
                 kwargs = self.inject_memory_context(kwargs, memory_context)
-        except Exception as e:
+        except _CAPTURE_ERRORS as e:
             # Log error but don't crash
-            import sys
             print(f"[Warning] Memory injection failed: {e}", file=sys.stderr)
 
         return kwargs
@@ -338,19 +340,14 @@ class BaseAPIInterceptor(BaseInterceptor):
         if not user_message:
             return
 
-        response = self._build_response_from_chunks(chunks)
-
-        from .utils import _save_conversation_turn
-        try:
+        turn = self._build_turn(user_message, chunks=chunks)
+        if turn:
             _save_conversation_turn(
                 provider=self.PROVIDER,
                 model=model_name,
-                request_messages=self.build_request_messages(user_message),
-                response_dict=self.build_response_dict(response=response)
+                request_messages=turn[0],
+                response_dict=turn[1],
             )
-        except Exception as e:
-            import sys
-            print(f"[Warning] Failed to save streaming conversation: {e}", file=sys.stderr)
 
     async def _save_streaming_turn_base_async(self, chunks: list, user_message: str, model_name: str):
         """
@@ -364,19 +361,38 @@ class BaseAPIInterceptor(BaseInterceptor):
         if not user_message:
             return
 
-        response = self._build_response_from_chunks(chunks)
-
-        from .utils import _save_conversation_turn_async
-        try:
+        turn = self._build_turn(user_message, chunks=chunks)
+        if turn:
             await _save_conversation_turn_async(
                 provider=self.PROVIDER,
                 model=model_name,
-                request_messages=self.build_request_messages(user_message),
-                response_dict=self.build_response_dict(response=response)
+                request_messages=turn[0],
+                response_dict=turn[1],
             )
+
+    def _build_turn(self, user_message: str, response: Any = None, chunks: list = None) -> Optional[Tuple[list, dict]]:
+        """
+        Build the request messages and response dict of a conversation turn.
+
+        Capturing is best-effort: a response the interceptor can't convert
+        (e.g. a blocked candidate whose accessors raise) skips the turn with a
+        warning instead of failing the provider call that already succeeded.
+
+        Args:
+            user_message: User message content
+            response: Provider response (non-streaming)
+            chunks: List of streaming chunks collected, used instead of response
+
+        Returns:
+            (request_messages, response_dict), or None if the turn can't be built
+        """
+        try:
+            if chunks is not None:
+                response = self._build_response_from_chunks(chunks)
+            return self.build_request_messages(user_message), self.build_response_dict(response=response)
         except Exception as e:
-            import sys
-            print(f"[Warning] Failed to save streaming conversation: {e}", file=sys.stderr)
+            print(f"[Warning] Failed to build conversation turn, skipping it: {e}", file=sys.stderr)
+            return None
 
     @abstractmethod
     def _build_response_from_chunks(self, chunks: list) -> Any:
@@ -428,7 +444,6 @@ class BaseAPIInterceptor(BaseInterceptor):
 
         @functools.wraps(original_method)
         def wrapper(self_arg, *args, **kwargs):
-            from ..core import get_current_config
 
             config = get_current_config()
             if not config:
@@ -457,17 +472,14 @@ class BaseAPIInterceptor(BaseInterceptor):
                 # Non-streaming - extract and save immediately
                 model_name = interceptor.extract_model_name(response=response, model_self=self_arg)
 
-                from .utils import _save_conversation_turn
-                try:
+                turn = interceptor._build_turn(user_message, response)
+                if turn:
                     _save_conversation_turn(
                         provider=interceptor.PROVIDER,
                         model=model_name,
-                        request_messages=interceptor.build_request_messages(user_message),
-                        response_dict=interceptor.build_response_dict(response=response)
+                        request_messages=turn[0],
+                        response_dict=turn[1],
                     )
-                except Exception as e:
-                    import sys
-                    print(f"[Warning] Failed to save conversation: {e}", file=sys.stderr)
 
                 return response
 
@@ -489,7 +501,6 @@ class BaseAPIInterceptor(BaseInterceptor):
 
         @functools.wraps(original_method)
         async def wrapper(self_arg, *args, **kwargs):
-            from ..core import get_current_config
 
             config = get_current_config()
             if not config:
@@ -518,17 +529,14 @@ class BaseAPIInterceptor(BaseInterceptor):
                 # Non-streaming - extract and save immediately
                 model_name = interceptor.extract_model_name(response=response, model_self=self_arg)
 
-                from .utils import _save_conversation_turn_async
-                try:
+                turn = interceptor._build_turn(user_message, response)
+                if turn:
                     await _save_conversation_turn_async(
                         provider=interceptor.PROVIDER,
                         model=model_name,
-                        request_messages=interceptor.build_request_messages(user_message),
-                        response_dict=interceptor.build_response_dict(response=response)
+                        request_messages=turn[0],
+                        response_dict=turn[1],
                     )
-                except Exception as e:
-                    import sys
-                    print(f"[Warning] Failed to save conversation: {e}", file=sys.stderr)
 
                 return response
 
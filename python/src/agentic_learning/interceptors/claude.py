@@ -7,12 +7,13 @@ This interceptor patches the SubprocessCLITransport layer to capture messages
 going in/out of the Claude subprocess.
 """
 
-import asyncio
+import io
 import json
 from typing import Any, AsyncIterator
 
-from ..core import get_current_config
+from ..core import LearningConfig, get_current_config
 from .base import BaseInterceptor
+from .utils import _CAPTURE_ERRORS, _call_client, _save_conversation_turn_async
 
 
 class ClaudeInterceptor(BaseInterceptor):
@@ -112,7 +113,7 @@ class ClaudeInterceptor(BaseInterceptor):
     # Claude SDK-specific helper methods
     # =========================================================================
 
-    async def _inject_memory_async(self, options, config: dict):
+    async def _inject_memory_async(self, options, config: LearningConfig):
         """
         Inject memory into Claude Agent options.
 
@@ -124,22 +125,18 @@ class ClaudeInterceptor(BaseInterceptor):
             config: Current memory configuration
         """
         # Check if capture_only is enabled
-        if config.get('capture_only', False):
+        if config.capture_only:
             return
 
-        client = config.get('client')
-        agent_name = config.get('agent_name')
+        client = config.client
+        agent_name = config.agent_name
 
         if not client or not agent_name:
             return
 
         try:
-            # Retrieve memory context (run sync client in thread pool)
-            loop = asyncio.get_event_loop()
-            memory_context = await loop.run_in_executor(
-                None,
-                lambda: client.memory.context.retrieve(agent=agent_name)
-            )
+            # Retrieve memory context (awaited for async clients, thread pool for sync clients)
+            memory_context = await _call_client(client.memory.context.retrieve, agent=agent_name)
 
             if not memory_context:
                 return
@@ -156,11 +153,11 @@ class ClaudeInterceptor(BaseInterceptor):
                     # Create new system prompt
                     options.system_prompt = memory_context
 
-        except Exception:
-            # Don't crash if memory injection fails
+        except _CAPTURE_ERRORS:
+            # Don't crash if memory retrieval fails
             pass
 
-    async def _capture_outgoing_message(self, data: str, config: dict):
+    async def _capture_outgoing_message(self, data: str, config: LearningConfig):
         """
         Capture user messages from outgoing transport data.
 
@@ -181,15 +178,14 @@ class ClaudeInterceptor(BaseInterceptor):
 
                 if content:
                     # Buffer the user message instead of saving immediately
-                    config["pending_user_message"] = content
+                    config.runtime.pending_user_message = content
 
-        except json.JSONDecodeError:
-            pass
-        except Exception:
+        except (json.JSONDecodeError, AttributeError):
+            # Not a JSON message object; nothing to capture
             pass
 
     async def _wrap_message_iterator(
-        self, original_iterator: AsyncIterator[dict], config: dict
+        self, original_iterator: AsyncIterator[dict], config: LearningConfig
     ) -> AsyncIterator[dict]:
         """
         Wrap the message iterator to accumulate and save assistant responses.
@@ -201,7 +197,7 @@ class ClaudeInterceptor(BaseInterceptor):
         Yields:
             Same messages as original iterator
         """
-        accumulated_text = []
+        accumulated_text = io.StringIO()
 
         try:
             async for message in original_iterator:
@@ -217,28 +213,26 @@ class ClaudeInterceptor(BaseInterceptor):
                         if block.get("type") == "text":
                             text = block.get("text", "")
                             if text:
-                                accumulated_text.append(text)
+                                accumulated_text.write(text)
 
                 # Always yield immediately for streaming
                 yield message
 
         finally:
             # Save user message + assistant response to Letta (separately)
-            user_message = config.get("pending_user_message")
-            assistant_message = "".join(accumulated_text) if accumulated_text else None
+            user_message = config.runtime.pending_user_message
+            assistant_message = accumulated_text.getvalue() or None
 
             # Only save if we have at least one message
             if user_message or assistant_message:
                 # Save conversation turn
-                from .utils import _save_conversation_turn_async
 
                 await _save_conversation_turn_async(
                     provider=self.PROVIDER,
                     model="claude",
                     request_messages=self.build_request_messages(user_message) if user_message else [],
                     response_dict={"role": "assistant", "content": assistant_message} if assistant_message else {"role": "assistant", "content": ""},
-                    register_task=True,
                 )
 
                 # Clear the buffer
-                config["pending_user_message"] = None
+                config.runtime.pending_user_message = None
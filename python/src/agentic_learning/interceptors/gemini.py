@@ -4,6 +4,7 @@ Gemini Interceptor
 Interceptor for Google Generative AI SDK (Gemini).
 """
 
+import functools
 from typing import Any, AsyncGenerator, Generator
 
 from .base import BaseAPIInterceptor
@@ -235,7 +236,6 @@ class GeminiInterceptor(BaseAPIInterceptor):
         but memory injection modifies kwargs. This wrapper converts
         positional args to kwargs before calling the base intercept.
         """
-        import functools
 
         base_wrapper = self.intercept(original_method)
 
@@ -4,7 +4,10 @@ Interceptor Registry
 Auto-detection and registration of SDK interceptors.
 """
 
-from typing import List, Type
+import importlib
+import importlib.abc
+import sys
+from typing import Dict, List, Optional, Tuple, Type
 
 from .base import BaseInterceptor
 
@@ -12,9 +15,15 @@ from .base import BaseInterceptor
 # Registry of all available interceptor classes
 _INTERCEPTOR_CLASSES: List[Type[BaseInterceptor]] = []
 
+# Interceptors imported on demand: (SDK module name, "module.path:ClassName")
+_LAZY_INTERCEPTORS: List[Tuple[str, str]] = []
+
 # Store installed interceptor instances
 _INSTALLED_INTERCEPTORS: List[BaseInterceptor] = []
 
+# Memoized SDK availability per interceptor class
+_SDK_AVAILABLE: Dict[Type[BaseInterceptor], bool] = {}
+
 
 def register_interceptor(interceptor_class: Type[BaseInterceptor]):
     """
@@ -27,37 +36,212 @@ def register_interceptor(interceptor_class: Type[BaseInterceptor]):
         _INTERCEPTOR_CLASSES.append(interceptor_class)
 
 
+def register_lazy_interceptor(module_name: str, import_path: str):
+    """
+    Register an interceptor that is only imported once its SDK has been imported.
+
+    Args:
+        module_name: Name of the SDK module to watch (e.g. "openai")
+        import_path: Interceptor class location as "module.path:ClassName"
+    """
+    entry = (module_name, import_path)
+    if entry not in _LAZY_INTERCEPTORS:
+        _LAZY_INTERCEPTORS.append(entry)
+
+
+def _is_sdk_available(interceptor_class: Type[BaseInterceptor]) -> bool:
+    """
+    Check whether an interceptor's SDK is installed, probing only once.
+
+    Args:
+        interceptor_class: Interceptor class to check
+
+    Returns:
+        True if the SDK is available, False otherwise
+    """
+    available = _SDK_AVAILABLE.get(interceptor_class)
+    if available is None:
+        available = _SDK_AVAILABLE[interceptor_class] = bool(interceptor_class.is_available())
+    return available
+
+
+def _load_interceptor_class(import_path: str) -> Type[BaseInterceptor]:
+    """
+    Import an interceptor class from its "module.path:ClassName" location.
+
+    Args:
+        import_path: Interceptor class location
+
+    Returns:
+        Interceptor class
+    """
+    module_path, _, class_name = import_path.partition(":")
+    return getattr(importlib.import_module(module_path), class_name)
+
+
+def _install_interceptor(interceptor_class: Type[BaseInterceptor]) -> bool:
+    """
+    Instantiate and install an interceptor.
+
+    Args:
+        interceptor_class: Interceptor class to install
+
+    Returns:
+        True if installed, False if installation failed
+    """
+    try:
+        interceptor = interceptor_class()
+        interceptor.install()
+        _INSTALLED_INTERCEPTORS.append(interceptor)
+        return True
+    except Exception:
+        # Silently skip interceptors that fail to install
+        return False
+
+
+def _install_lazy_interceptor(import_path: str) -> Optional[str]:
+    """
+    Import and install a lazily registered interceptor.
+
+    Args:
+        import_path: Interceptor class location as "module.path:ClassName"
+
+    Returns:
+        Interceptor class name if installed, None if importing or installing failed
+    """
+    try:
+        interceptor_class = _load_interceptor_class(import_path)
+    except Exception:
+        # Silently skip interceptors that fail to import, e.g. against an
+        # incompatible SDK version, rather than failing the user's SDK import
+        return None
+
+    if _install_interceptor(interceptor_class):
+        return interceptor_class.__name__
+    return None
+
+
+# =============================================================================
+# SDK Import Hook
+# =============================================================================
+
+
+class _SDKImportHook(importlib.abc.MetaPathFinder):
+    """
+    Meta path finder that installs lazy interceptors when their SDK is imported.
+
+    The finder doesn't load anything itself: it asks the remaining finders for
+    the module's spec and wraps the loader's exec_module so the interceptor is
+    installed right after the SDK module finishes executing.
+    """
+
+    def __init__(self):
+        self.watched: Dict[str, str] = {}
+
+    def find_spec(self, fullname, path, target=None):
+        if fullname not in self.watched:
+            return None
+
+        for finder in sys.meta_path:
+            if finder is self or not hasattr(finder, "find_spec"):
+                continue
+            spec = finder.find_spec(fullname, path, target)
+            if spec is not None:
+                break
+        else:
+            return None
+
+        loader = spec.loader
+        if loader is None or not hasattr(loader, "exec_module"):
+            return spec
+
+        import_path = self.watched.pop(fullname)
+        if not self.watched:
+            _remove_import_hook()
+
+        exec_module = loader.exec_module
+
+        def exec_module_and_install(module):
+            exec_module(module)
+            _install_lazy_interceptor(import_path)
+
+        loader.exec_module = exec_module_and_install
+        return spec
+
+
+_import_hook: Optional[_SDKImportHook] = None
+
+
+def _watch_imports(watched: Dict[str, str]):
+    """
+    Install interceptors for SDKs as soon as they are imported.
+
+    Args:
+        watched: Map of SDK module name to interceptor import path
+    """
+    global _import_hook
+
+    if _import_hook is None:
+        _import_hook = _SDKImportHook()
+        sys.meta_path.insert(0, _import_hook)
+    _import_hook.watched.update(watched)
+
+
+def _remove_import_hook():
+    """Stop watching SDK imports."""
+    global _import_hook
+
+    if _import_hook is not None:
+        if _import_hook in sys.meta_path:
+            sys.meta_path.remove(_import_hook)
+        _import_hook = None
+
+
+# =============================================================================
+# Install / Uninstall
+# =============================================================================
+
+
 def install() -> List[str]:
     """
     Auto-detect and install available SDK interceptors.
 
     Checks each registered interceptor to see if its SDK is available,
-    and installs it if so.
+    and installs it if so. SDK availability is probed once per process.
+
+    Lazily registered interceptors are installed if their SDK has already
+    been imported; otherwise they are installed when the SDK is first imported,
+    so SDKs the application never uses are not imported at all.
 
     Returns:
         List of installed interceptor class names
     """
-    global _INSTALLED_INTERCEPTORS
-
     installed = []
     for interceptor_class in _INTERCEPTOR_CLASSES:
-        if interceptor_class.is_available():
-            try:
-                interceptor = interceptor_class()
-                interceptor.install()
-                _INSTALLED_INTERCEPTORS.append(interceptor)
-                installed.append(interceptor_class.__name__)
-            except Exception:
-                # Silently skip interceptors that fail to install
-                pass
+        if _is_sdk_available(interceptor_class) and _install_interceptor(interceptor_class):
+            installed.append(interceptor_class.__name__)
+
+    watched = {}
+    for module_name, import_path in _LAZY_INTERCEPTORS:
+        if module_name in sys.modules:
+            name = _install_lazy_interceptor(import_path)
+            if name:
+                installed.append(name)
+        else:
+            watched[module_name] = import_path
+
+    if watched:
+        _watch_imports(watched)
 
     return installed
 
 
 def uninstall_all():
-    """Uninstall all installed interceptors."""
+    """Uninstall all installed interceptors and stop watching SDK imports."""
     global _INSTALLED_INTERCEPTORS
 
+    _remove_import_hook()
+
     for interceptor in _INSTALLED_INTERCEPTORS:
         try:
             interceptor.uninstall()
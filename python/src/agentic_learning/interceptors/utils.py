@@ -4,12 +4,36 @@ Interceptor Utilities
 Shared utilities for SDK interceptors.
 """
 
-from typing import AsyncGenerator, Dict, Generator, List
+import asyncio
+import inspect
+import logging
+import sys
+from dataclasses import dataclass
+from typing import Any, AsyncGenerator, Dict, Generator, List, Optional, Set
+
+import httpx
+from letta_client import APIError
 
 from ..types import Provider
+from ..client.messages.client import _encode_capture_payload
 from ..core import get_current_config
 
 
+logger = logging.getLogger(__name__)
+
+# Network and HTTP failures that captures and memory lookups treat as best-effort.
+# Anything else (including cancellation) is a bug or a shutdown and propagates,
+# except in background capture batches, which log it (see CaptureBuffer._send).
+_CAPTURE_ERRORS = (
+    httpx.HTTPError,
+    httpx.StreamError,
+    httpx.InvalidURL,
+    APIError,
+    OSError,
+    asyncio.TimeoutError,
+)
+
+
 def wrap_streaming_generator(stream: Generator, callback):
     """
     Wrap a streaming generator to collect chunks and call callback when done.
@@ -22,9 +46,10 @@ def wrap_streaming_generator(stream: Generator, callback):
         Each chunk from the original stream
     """
     collected = []
+    append = collected.append
     try:
         for chunk in stream:
-            collected.append(chunk)
+            append(chunk)
             yield chunk
     finally:
         # After stream completes (or errors), call callback with collected content
@@ -36,22 +61,26 @@ async def wrap_streaming_generator_async(stream: AsyncGenerator, callback):
     """
     Wrap an async streaming generator to collect chunks and call callback when done.
 
+    The callback runs directly on the event loop (never in a thread pool) and is
+    shielded, so cancelling the consumer does not abort saving the turn.
+
     Args:
         stream: Original async generator
-        callback: Function to call with collected content when stream completes
+        callback: Async function to call with collected content when stream completes
 
     Yields:
         Each chunk from the original stream
     """
     collected = []
+    append = collected.append
     try:
         async for chunk in stream:
-            collected.append(chunk)
+            append(chunk)
             yield chunk
     finally:
         # After stream completes (or errors), call callback with collected content
         if collected:
-            await callback(collected)
+            await asyncio.shield(callback(collected))
 
 
 def _save_conversation_turn(
@@ -73,32 +102,27 @@ def _save_conversation_turn(
     if not config:
         return
 
-    agent = config["agent_name"]
-    client = config["client"]
+    agent = config.agent_name
+    client = config.client
 
     if not client:
         return
 
-    try:
-        # Get or create agent using simplified API
-        agent_state = client.agents.retrieve(agent=agent)
+    body = _encode_turn(request_messages, response_dict, model, provider)
+    if body is None:
+        return
 
-        if not agent_state:
-            agent_state = client.agents.create(
+    try:
+        # Resolve the agent ID (cached for the context), creating the agent if needed
+        if not client.agents._retrieve_id(agent=agent):
+            client.agents.create(
                 agent=agent,
-                memory=config["memory"],
+                memory=config.memory,
             )
 
-        return client.messages.capture(
-            agent=agent,
-            request_messages=request_messages or [],
-            response_dict=response_dict or {},
-            model=model,
-            provider=provider,
-        )
+        return client.messages._capture_turn(agent=agent, body=body)
 
-    except Exception as e:
-        import sys
+    except _CAPTURE_ERRORS as e:
         print(f"[Warning] Failed to save conversation turn: {e}", file=sys.stderr)
 
 
@@ -107,71 +131,289 @@ async def _save_conversation_turn_async(
     model: str,
     request_messages: List[dict] = None,
     response_dict: Dict[str, str] = None,
-    register_task: bool = False,
 ):
     """
-    Save a conversation turn to Letta in a single API call (async version).
+    Save a conversation turn to Letta (async version).
+
+    Inside an async learning context the turn is queued on the context's capture
+    buffer so the caller does not wait on the Letta round-trip; the context
+    flushes its buffer on exit. Inside a sync learning context (e.g. around an
+    async provider call) there is no buffer, so the turn is saved inline.
 
     Args:
         provider: Provider of the messages (e.g. "gemini", "claude", "anthropic", "openai")
         model: Model name
         request_messages: List of request messages
         response_dict: Response from provider
-        register_task: If True, create and register task instead of awaiting directly.
-                      Use this for async generators where the context might exit during cleanup.
-                      (default: False - executes immediately)
     """
     config = get_current_config()
     if not config:
         return
 
-    agent = config["agent_name"]
-    client = config["client"]
-    memory = config.get("memory")
+    client = config.client
 
     if not client:
         return
 
-    async def save_task():
+    body = _encode_turn(request_messages, response_dict, model, provider)
+    if body is None:
+        return
+
+    if config.capture_buffer is None:
         try:
-            import asyncio
-            loop = asyncio.get_event_loop()
+            await _capture_turns(client, config.agent_name, config.memory, [body])
+        except _CAPTURE_ERRORS as e:
+            print(f"[Warning] Failed to save conversation turn: {e}", file=sys.stderr)
+        return
 
-            # Get or create agent using sync client in thread pool
-            agent_state = await loop.run_in_executor(
-                None,
-                lambda: client.agents.retrieve(agent=agent)
-            )
+    config.capture_buffer.put(QueuedCapture(
+        client=client,
+        agent=config.agent_name,
+        memory=config.memory,
+        body=body,
+    ))
+
+
+def _encode_turn(
+    request_messages: Optional[List[dict]],
+    response_dict: Optional[dict],
+    model: str,
+    provider: Provider,
+) -> Optional[bytes]:
+    """
+    Encode a conversation turn, skipping turns that can't be serialized.
+
+    Args:
+        request_messages: List of request messages
+        response_dict: Response from provider
+        model: Model name
+        provider: Provider of the messages
+
+    Returns:
+        Encoded capture request body, or None if the turn can't be serialized
+    """
+    try:
+        return _encode_capture_payload(request_messages, response_dict, model, provider)
+    except (TypeError, ValueError) as e:
+        print(f"[Warning] Failed to encode conversation turn, skipping it: {e}", file=sys.stderr)
+        return None
+
+
+# =============================================================================
+# Capture Buffer
+# =============================================================================
+
+
+# Strong references to in-flight capture tasks. The event loop only keeps weak
+# references, so sends still running after their learning context (and buffer)
+# is gone would otherwise be garbage collected mid-flight.
+_BACKGROUND_TASKS: Set[asyncio.Task] = set()
+
+
+@dataclass(slots=True)
+class QueuedCapture:
+    """
+    Conversation turn waiting in a capture buffer.
+
+    Attributes:
+        client: AgenticLearning or AsyncAgenticLearning client to capture with
+        agent: Name of the agent the turn belongs to
+        memory: Memory block labels used if the agent has to be created
+        body: Encoded capture request body, also used to detect duplicates
+    """
+
+    client: Any
+    agent: str
+    memory: Optional[List[str]]
+    body: bytes
 
-            if not agent_state:
-                agent_state = await loop.run_in_executor(
-                    None,
-                    lambda: client.agents.create(
-                        agent=agent,
-                        memory=memory,
-                    )
-                )
 
-            return await loop.run_in_executor(
-                None,
-                lambda: client.messages.capture(
-                    agent=agent,
-                    request_messages=request_messages or [],
-                    response_dict=response_dict or {},
-                    model=model,
-                    provider=provider,
+class CaptureBuffer:
+    """
+    Buffer that coalesces async conversation captures into batches.
+
+    Turns are queued instead of being saved one request at a time. A batch is
+    sent once `max_batch` turns are queued or `flush_interval` seconds after the
+    first queued turn, whichever comes first. Each agent in a batch is resolved
+    once, and its turns are then captured in order. A turn identical to one
+    already queued for the same agent (e.g. from a retried request) is skipped.
+
+    At most `max_backlog` turns are held (queued or in flight). While Letta is
+    too slow to keep up, new turns beyond that are dropped rather than growing
+    memory without bound.
+    """
+
+    def __init__(
+        self,
+        max_batch: int = 16,
+        flush_interval: float = 0.25,
+        max_concurrency: int = 32,
+        max_backlog: int = 1024,
+    ):
+        """
+        Initialize the capture buffer.
+
+        Args:
+            max_batch: Number of queued turns that triggers an immediate flush
+            flush_interval: Seconds to wait for more turns before flushing
+            max_concurrency: Maximum number of agents captured concurrently
+            max_backlog: Maximum number of queued and in-flight turns before new turns are dropped
+        """
+        self.max_batch = max_batch
+        self.flush_interval = flush_interval
+        self.max_backlog = max_backlog
+        self._backlog = 0
+        self._dropping = False
+        self._semaphore = asyncio.Semaphore(max_concurrency)
+        self._pending: List[QueuedCapture] = []
+        self._pending_keys: Set[tuple] = set()
+        self._timer: Optional[asyncio.TimerHandle] = None
+        self._tasks: Set[asyncio.Task] = set()
+
+    def put(self, capture: QueuedCapture):
+        """
+        Queue a capture, scheduling a flush if needed.
+
+        Args:
+            capture: Conversation turn to queue
+        """
+        if self._backlog >= self.max_backlog:
+            if not self._dropping:
+                self._dropping = True
+                print(
+                    f"[Warning] Capture backlog full ({self.max_backlog} turns), dropping conversation turns",
+                    file=sys.stderr,
                 )
+            return
+
+        # Skip duplicates of a turn still waiting in this batch window
+        key = (id(capture.client), capture.agent, capture.body)
+        if key in self._pending_keys:
+            return
+        self._pending_keys.add(key)
+
+        self._dropping = False
+        self._backlog += 1
+        self._pending.append(capture)
+        if len(self._pending) >= self.max_batch:
+            self._send_pending()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(self.flush_interval, self._send_pending)
+
+    async def flush(self, timeout: float = 5.0):
+        """
+        Send all queued captures and wait for in-flight batches.
+
+        Args:
+            timeout: Grace period in seconds before giving up on in-flight captures
+        """
+        self._send_pending()
+        if self._tasks:
+            await asyncio.wait(set(self._tasks), timeout=timeout)
+
+    def _send_pending(self):
+        """Send the queued captures as one batch in a background task."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+
+        if not self._pending:
+            return
+
+        batch, self._pending = self._pending, []
+        self._pending_keys.clear()
+        task = asyncio.create_task(self._send(batch))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+        _BACKGROUND_TASKS.add(task)
+        task.add_done_callback(_BACKGROUND_TASKS.discard)
+
+    async def _send(self, batch: List[QueuedCapture]):
+        """
+        Send a batch of captures, grouped by client and agent.
+
+        Args:
+            batch: Queued captures
+        """
+        groups: Dict[tuple, List[QueuedCapture]] = {}
+        for capture in batch:
+            groups.setdefault((id(capture.client), capture.agent), []).append(capture)
+
+        try:
+            results = await asyncio.gather(
+                *(self._send_group(captures) for captures in groups.values()),
+                return_exceptions=True,
             )
+        finally:
+            self._backlog -= len(batch)
 
-        except Exception as e:
-            import sys
-            print(f"[Warning] Failed to save conversation turn: {e}", file=sys.stderr)
+        # Network failures are already reported by _send_group. Anything else is a
+        # bug; nobody awaits this background task, so log it rather than leaving
+        # it as an unretrieved task exception.
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error("Unexpected error while saving conversation turns", exc_info=result)
+
+    async def _send_group(self, captures: List[QueuedCapture]):
+        """
+        Resolve the agent once, then capture its turns in order.
+
+        Args:
+            captures: Queued captures sharing the same client and agent
+        """
+        first = captures[0]
+
+        async with self._semaphore:
+            try:
+                await _capture_turns(
+                    first.client,
+                    first.agent,
+                    first.memory,
+                    [capture.body for capture in captures],
+                )
+            except _CAPTURE_ERRORS as e:
+                print(f"[Warning] Failed to save conversation turn: {e}", file=sys.stderr)
+
+
+async def _capture_turns(client, agent: str, memory: Optional[List[str]], bodies: List[bytes]):
+    """
+    Resolve the agent once, creating it if needed, then capture turns in order.
+
+    Args:
+        client: AgenticLearning or AsyncAgenticLearning client to capture with
+        agent: Name of the agent the turns belong to
+        memory: Memory block labels used if the agent has to be created
+        bodies: Encoded capture request bodies
+    """
+    # Resolve the agent ID (cached for the context), creating the agent if needed
+    if not await _call_client(client.agents._retrieve_id, agent=agent):
+        await _call_client(
+            client.agents.create,
+            agent=agent,
+            memory=memory,
+        )
+
+    for body in bodies:
+        await _call_client(client.messages._capture_turn, agent=agent, body=body)
+
+
+async def _call_client(method, **kwargs):
+    """
+    Call a sync or async client method from async code.
+
+    Async client methods are awaited directly; sync client methods run in the
+    default thread pool so they don't block the event loop. The thread runs in
+    a copy of the caller's context so the method sees the active learning config
+    (e.g. to reuse and cache the resolved agent ID).
+
+    Args:
+        method: Bound client method to call
+        **kwargs: Keyword arguments for the method
+
+    Returns:
+        Result of the client method
+    """
+    if inspect.iscoroutinefunction(method):
+        return await method(**kwargs)
 
-    if register_task:
-        # Create and register the task for later awaiting (used by Claude interceptor)
-        import asyncio
-        task = asyncio.create_task(save_task())
-        config.get("pending_tasks", []).append(task)
-    else:
-        # Execute immediately (used by other interceptors)
-        await save_task()
+    return await asyncio.to_thread(method, **kwargs)
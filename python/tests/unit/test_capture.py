@@ -0,0 +1,300 @@
+"""
+Unit tests for the async conversation capture path.
+
+These tests use a real AsyncAgenticLearning client with mocked Letta and HTTP
+clients (no Letta server required).
+"""
+
+import asyncio
+import datetime
+import threading
+import uuid
+import weakref
+
+import httpx
+import pytest
+from unittest.mock import AsyncMock, MagicMock, patch
+
+from agentic_learning import AgenticLearning, AsyncAgenticLearning, core
+from agentic_learning.client.messages import client as messages_client
+from agentic_learning.client.messages.client import _encode_payload, _get_async_http_client
+from agentic_learning.core import get_current_config, learning
+from agentic_learning.interceptors.openai import OpenAIInterceptor
+from agentic_learning.interceptors.utils import CaptureBuffer, QueuedCapture, _encode_turn, _save_conversation_turn_async
+
+
+@pytest.fixture
+def async_learning_client():
+    """AsyncAgenticLearning client with a mocked AsyncLetta backend."""
+    client = AsyncAgenticLearning(base_url="http://letta.test", api_key="fake-key")
+
+    letta = MagicMock()
+    letta.agents.list = AsyncMock(return_value=MagicMock(items=[MagicMock(id="agent-123")]))
+    client.agents._letta = letta
+
+    return client
+
+
+@pytest.fixture
+def http_post():
+    """Mocked POST on the shared async HTTP client used for captures."""
+    post = AsyncMock(return_value=MagicMock(status_code=200, json=MagicMock(return_value={"success": True})))
+    http_client = MagicMock(post=post)
+
+    with patch("agentic_learning.client.messages.client._get_async_http_client", return_value=http_client):
+        yield post
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_async_capture_url_uses_agent_id(async_learning_client, http_post):
+    """Test async captures await the agent lookup and POST to the agent's capture URL."""
+    async with learning(agent="capture-agent", client=async_learning_client):
+        await _save_conversation_turn_async(
+            provider="openai",
+            model="gpt-5",
+            request_messages=[{"role": "user", "content": "Hello"}],
+            response_dict={"role": "assistant", "content": "Hi"},
+        )
+
+    http_post.assert_awaited_once()
+    url = http_post.await_args.args[0]
+    assert isinstance(url, str)
+    assert url == "http://letta.test/v1/agents/agent-123/messages/capture"
+    assert http_post.await_args.kwargs["headers"]["Authorization"] == "Bearer fake-key"
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_async_context_batches_captures(async_learning_client, http_post):
+    """Test async contexts send a batch once batch_max turns are queued and flush the rest on exit."""
+    async with learning(
+        agent="capture-agent",
+        client=async_learning_client,
+        batch_max=2,
+        batch_max_delay_ms=60_000,
+    ) as ctx:
+        for i in range(3):
+            await _save_conversation_turn_async(
+                provider="openai",
+                model="gpt-5",
+                request_messages=[{"role": "user", "content": f"Hello {i}"}],
+                response_dict={"role": "assistant", "content": "Hi"},
+            )
+        # The first two turns were handed off as a batch; the third waits for the delay
+        assert len(ctx._capture_buffer._pending) == 1
+
+    # Exiting the context flushes the remaining turn without waiting for the delay
+    assert http_post.await_count == 3
+    # The agent is resolved once and reused for both batches
+    assert async_learning_client.agents._letta.agents.list.await_count == 1
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_sync_context_saves_async_turn_inline(async_learning_client, http_post):
+    """Test an async save inside a sync context is sent before returning, since nothing flushes it later."""
+    with learning(agent="capture-agent", client=async_learning_client):
+        await _save_conversation_turn_async(
+            provider="openai",
+            model="gpt-5",
+            request_messages=[{"role": "user", "content": "Hello"}],
+            response_dict={"role": "assistant", "content": "Hi"},
+        )
+        http_post.assert_awaited_once()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_capture_buffer_drops_turns_beyond_backlog():
+    """Test the capture buffer drops new turns once max_backlog turns are queued or in flight."""
+    buffer = CaptureBuffer(max_batch=100, flush_interval=60, max_backlog=2)
+    for i in range(3):
+        buffer.put(QueuedCapture(client=None, agent="capture-agent", memory=None, body=b"%d" % i))
+
+    assert [capture.body for capture in buffer._pending] == [b"0", b"1"]
+    buffer._timer.cancel()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_capture_buffer_skips_duplicate_turns():
+    """Test identical turns for the same agent are queued once per batch window."""
+    buffer = CaptureBuffer(max_batch=100, flush_interval=60)
+    for agent in ["capture-agent", "capture-agent", "other-agent"]:
+        buffer.put(QueuedCapture(client=None, agent=agent, memory=None, body=b'{"model":"gpt-5"}'))
+
+    assert [capture.agent for capture in buffer._pending] == ["capture-agent", "other-agent"]
+    buffer._timer.cancel()
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_capture_errors_only_swallow_network_failures(async_learning_client, http_post, capsys):
+    """Test network failures are reported as warnings while other errors propagate."""
+    http_post.side_effect = httpx.ConnectError("connection refused")
+    with learning(agent="capture-agent", client=async_learning_client):
+        await _save_conversation_turn_async(provider="openai", model="gpt-5")
+    assert "Failed to save conversation turn" in capsys.readouterr().err
+
+    http_post.side_effect = KeyError("bug")
+    with pytest.raises(KeyError):
+        with learning(agent="capture-agent", client=async_learning_client):
+            await _save_conversation_turn_async(provider="openai", model="gpt-5")
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_buffered_capture_errors_are_logged(async_learning_client, http_post, caplog):
+    """Test unexpected errors in background capture batches are logged, not left on the task."""
+    http_post.side_effect = KeyError("bug")
+    async with learning(agent="capture-agent", client=async_learning_client):
+        await _save_conversation_turn_async(provider="openai", model="gpt-5")
+
+    http_post.assert_awaited_once()
+    [record] = [r for r in caplog.records if r.name == "agentic_learning.interceptors.utils"]
+    assert isinstance(record.exc_info[1], KeyError)
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_unencodable_turn_is_skipped(async_learning_client, http_post, capsys):
+    """Test a turn that can't be serialized is skipped with a warning."""
+    with learning(agent="capture-agent", client=async_learning_client):
+        await _save_conversation_turn_async(provider="openai", model="gpt-5", response_dict={"content": object()})
+
+    http_post.assert_not_awaited()
+    assert "Failed to encode conversation turn" in capsys.readouterr().err
+
+
+@pytest.mark.unit
+def test_stdlib_encoding_matches_orjson(monkeypatch):
+    """Test the stdlib fallback encodes the types orjson supports natively the same way."""
+    orjson = pytest.importorskip("orjson")
+    payload = {
+        "created": datetime.datetime(2025, 1, 2, 3, 4, 5, 6789, tzinfo=datetime.timezone.utc),
+        "day": datetime.date(2025, 1, 2),
+        "id": uuid.UUID(int=1),
+        "content": "héllo",
+    }
+
+    monkeypatch.setattr(messages_client, "orjson", None)
+
+    assert _encode_payload(payload) == orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS)
+
+
+@pytest.mark.unit
+def test_nan_turn_is_skipped_without_orjson(monkeypatch, capsys):
+    """Test the stdlib fallback rejects NaN instead of sending invalid JSON."""
+    monkeypatch.setattr(messages_client, "orjson", None)
+
+    assert _encode_turn([], {"score": float("nan")}, "gpt-5", "openai") is None
+    assert "Failed to encode conversation turn" in capsys.readouterr().err
+
+
+@pytest.mark.unit
+def test_unbuildable_response_is_skipped(capsys):
+    """Test a response whose accessors raise skips the turn instead of failing the provider call."""
+    class BlockedResponse:
+        @property
+        def output(self):
+            raise ValueError("response was blocked")
+
+    assert OpenAIInterceptor()._build_turn("Hello", BlockedResponse()) is None
+    assert "Failed to build conversation turn" in capsys.readouterr().err
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_nested_context_with_same_settings_reuses_config(async_learning_client):
+    """Test re-entering learning() with identical settings keeps the active config."""
+    async with learning(agent="capture-agent", client=async_learning_client):
+        outer = get_current_config()
+
+        async with learning(agent="capture-agent", client=async_learning_client):
+            assert get_current_config() is outer
+
+        async with learning(agent="other-agent", client=async_learning_client):
+            assert get_current_config() is not outer
+
+        assert get_current_config() is outer
+
+    assert get_current_config() is None
+
+
+@pytest.mark.unit
+def test_loop_bound_clients_are_closed_with_their_loop(monkeypatch):
+    """Test the default async client and capture pool are closed when their event loop shuts down."""
+    monkeypatch.setattr(core, "_default_async_client", None)
+    monkeypatch.setattr(core, "_default_async_clients", weakref.WeakKeyDictionary())
+
+    async def get_clients():
+        return core._get_default_async_client(), _get_async_http_client()
+
+    learning_client, http_client = asyncio.run(get_clients())
+    assert learning_client.letta.is_closed()
+    assert http_client.is_closed
+
+    # A new loop gets fresh clients
+    next_learning_client, next_http_client = asyncio.run(get_clients())
+    assert next_learning_client is not learning_client
+    assert next_http_client is not http_client
+
+
+@pytest.mark.unit
+def test_setting_sync_default_keeps_async_defaults_per_loop(monkeypatch):
+    """Test setting a sync default client does not pin a closed async default to later loops."""
+    monkeypatch.setattr(core, "_default_client", None)
+    monkeypatch.setattr(core, "_default_async_client", None)
+    monkeypatch.setattr(core, "_default_async_clients", weakref.WeakKeyDictionary())
+
+    async def get_client():
+        return core._get_default_async_client()
+
+    first = asyncio.run(get_client())
+    core.set_default_client(AgenticLearning(base_url="http://letta.test", api_key="fake-key"))
+    second = asyncio.run(get_client())
+
+    assert first.letta.is_closed()
+    assert second is not first
+
+
+@pytest.mark.unit
+@pytest.mark.asyncio
+async def test_aclose_leaves_shared_capture_pool_open():
+    """Test closing one async client does not close the capture pool other clients share."""
+    http_client = _get_async_http_client()
+
+    async with AsyncAgenticLearning(base_url="http://letta.test", api_key="fake-key") as client:
+        pass
+
+    assert client.letta.is_closed()
+    assert not http_client.is_closed
+    assert _get_async_http_client() is http_client
+
+
+@pytest.mark.unit
+def test_capture_pool_is_kept_per_event_loop():
+    """Test loops running in different threads each keep their own capture pool."""
+    seen = {}
+
+    async def get_pools():
+        pools = set()
+        for _ in range(20):
+            pools.add(_get_async_http_client())
+            # Let the other thread's loop run in between
+            await asyncio.sleep(0.005)
+        return pools
+
+    def run(name):
+        seen[name] = asyncio.run(get_pools())
+
+    threads = [threading.Thread(target=run, args=(name,)) for name in ("a", "b")]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(seen["a"]) == 1
+    assert len(seen["b"]) == 1
+    assert seen["a"] != seen["b"]
@@ -0,0 +1,86 @@
+"""
+Unit tests for the shared example helpers in examples/utils.py.
+
+The helpers read real stdin, so each test runs them in a subprocess.
+"""
+
+import subprocess
+import sys
+import threading
+from pathlib import Path
+
+import pytest
+
+
+EXAMPLES_DIR = Path(__file__).resolve().parents[3] / "examples"
+
+# Reads prompts until EOF and prints each line it got
+READ_LINES = """
+import asyncio
+from utils import async_input
+
+async def main():
+    while True:
+        try:
+            print("got", repr(await async_input("> ")))
+        except EOFError:
+            print("eof")
+            return
+
+asyncio.run(main())
+"""
+
+
+def run_reader(stdin, input=None):
+    """Start the line reader with the given stdin and return its output."""
+    return subprocess.run(
+        [sys.executable, "-c", READ_LINES],
+        cwd=EXAMPLES_DIR,
+        stdin=stdin,
+        input=input,
+        capture_output=True,
+        text=True,
+        timeout=10,
+    )
+
+
+@pytest.mark.unit
+def test_async_input_reads_redirected_file(tmp_path):
+    """Test async_input reads every line of a file redirected to stdin."""
+    prompts = tmp_path / "prompts.txt"
+    prompts.write_text("a\nb\n")
+
+    with prompts.open() as stdin:
+        result = run_reader(stdin)
+
+    assert result.returncode == 0, result.stderr
+    assert "got 'a'" in result.stdout
+    assert "got 'b'" in result.stdout
+    assert "eof" in result.stdout
+
+
+@pytest.mark.unit
+def test_async_input_reads_all_piped_lines():
+    """Test async_input returns each piped line while the pipe stays open."""
+    process = subprocess.Popen(
+        [sys.executable, "-c", READ_LINES],
+        cwd=EXAMPLES_DIR,
+        stdin=subprocess.PIPE,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        text=True,
+    )
+    # Fail instead of hanging if a line is never returned
+    watchdog = threading.Timer(10, process.kill)
+    watchdog.start()
+    try:
+        process.stdin.write("a\nb\n")
+        process.stdin.flush()
+
+        # Both lines arrive before the pipe is closed
+        assert "got 'a'" in process.stdout.readline()
+        assert "got 'b'" in process.stdout.readline()
+    finally:
+        watchdog.cancel()
+        process.stdin.close()
+        process.wait(timeout=10)
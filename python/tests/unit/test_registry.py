@@ -0,0 +1,110 @@
+"""
+Unit tests for lazy interceptor registration.
+
+These tests use a generated fake SDK module instead of a real provider SDK.
+"""
+
+import importlib
+import sys
+import uuid
+
+import pytest
+
+from agentic_learning.interceptors import registry
+from agentic_learning.interceptors.base import BaseInterceptor
+
+
+class FakeInterceptor(BaseInterceptor):
+    """Interceptor that only records whether it is installed."""
+
+    PROVIDER = "fake"
+    installed = False
+
+    @classmethod
+    def is_available(cls) -> bool:
+        return True
+
+    def install(self):
+        FakeInterceptor.installed = True
+
+    def uninstall(self):
+        FakeInterceptor.installed = False
+
+    def build_request_messages(self, user_message: str) -> list:
+        return []
+
+    def build_response_dict(self, response) -> dict:
+        return {}
+
+
+@pytest.fixture
+def fake_sdk(tmp_path, monkeypatch):
+    """Name of an importable fake SDK module, watched by a fresh registry."""
+    name = f"fake_sdk_{uuid.uuid4().hex[:8]}"
+    (tmp_path / f"{name}.py").write_text("LOADED = True\n")
+    monkeypatch.syspath_prepend(str(tmp_path))
+
+    monkeypatch.setattr(registry, "_INTERCEPTOR_CLASSES", [])
+    monkeypatch.setattr(registry, "_LAZY_INTERCEPTORS", [])
+    monkeypatch.setattr(registry, "_INSTALLED_INTERCEPTORS", [])
+    # Leave any hook installed by earlier tests in place, but out of the registry's reach
+    monkeypatch.setattr(registry, "_import_hook", None)
+    monkeypatch.setattr(FakeInterceptor, "installed", False)
+
+    yield name
+
+    registry._remove_import_hook()
+    sys.modules.pop(name, None)
+
+
+@pytest.mark.unit
+def test_sdk_imported_before_install(fake_sdk):
+    """Test an interceptor whose SDK is already imported is installed immediately."""
+    importlib.import_module(fake_sdk)
+    registry.register_lazy_interceptor(fake_sdk, f"{__name__}:FakeInterceptor")
+
+    assert registry.install() == ["FakeInterceptor"]
+    assert FakeInterceptor.installed
+    assert registry._import_hook is None
+
+
+@pytest.mark.unit
+def test_sdk_imported_after_install(fake_sdk):
+    """Test an interceptor is installed once its SDK is imported, and the hook then removes itself."""
+    registry.register_lazy_interceptor(fake_sdk, f"{__name__}:FakeInterceptor")
+
+    assert registry.install() == []
+    assert not FakeInterceptor.installed
+    assert registry._import_hook in sys.meta_path
+
+    module = importlib.import_module(fake_sdk)
+
+    assert module.LOADED
+    assert FakeInterceptor.installed
+    assert registry._import_hook is None
+
+
+@pytest.mark.unit
+def test_uninstall_all_removes_import_hook(fake_sdk):
+    """Test uninstall_all() stops watching SDK imports."""
+    registry.register_lazy_interceptor(fake_sdk, f"{__name__}:FakeInterceptor")
+    registry.install()
+    hook = registry._import_hook
+
+    registry.uninstall_all()
+    importlib.import_module(fake_sdk)
+
+    assert hook not in sys.meta_path
+    assert not FakeInterceptor.installed
+
+
+@pytest.mark.unit
+def test_broken_interceptor_does_not_break_sdk_import(fake_sdk):
+    """Test an interceptor that fails to import is skipped without failing the SDK import."""
+    registry.register_lazy_interceptor(fake_sdk, "agentic_learning.interceptors.missing:MissingInterceptor")
+    registry.install()
+
+    module = importlib.import_module(fake_sdk)
+
+    assert module.LOADED
+    assert registry._INSTALLED_INTERCEPTORS == []